@@ -0,0 +1,209 @@
+# app/cli.py
+# Headless batch screening of a folder of resumes against one JD:
+#   python -m app.cli --jd jd.txt --resumes "resumes/*.pdf" --out results.jsonl [--resume]
+import sys
+import os
+import argparse
+import csv
+import glob
+import json
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from preprocessing.resume_parser import iter_resume_paths, parse_resume_file, run_in_pool
+from embeddings.batch_screener import prepare_jd, score_resume
+from embeddings.similarity_engine import ATSScorer
+
+FIELDS = ["path", "candidate_id", "ats_score", "keyword_score", "role",
+          "resume_skills", "required_skills", "missing_skills", "error"]
+LIST_FIELDS = ("resume_skills", "required_skills", "missing_skills")
+
+def _candidate_id(path, root):
+    """Path relative to the common input folder ("team_a/r.pdf"): unique across folders and formats."""
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+# Per worker process: the JD's vector is built once, not refitted per resume
+_scorer = (None, None)
+
+def _get_scorer(jd_text):
+    global _scorer
+    if _scorer[0] != jd_text:
+        _scorer = (jd_text, ATSScorer(jd_text))
+    return _scorer[1]
+
+def _screen_file(path, jd_state, timeout, root):
+    """Pool worker: parse + score one resume. Errors are reported in the row."""
+    path, text, error = parse_resume_file(path, timeout)
+    candidate_id = _candidate_id(path, root)
+    if error is None and not text.strip():
+        error = "Resume appears empty"
+    if error is not None:
+        return {"path": path, "candidate_id": candidate_id, "error": error}
+
+    row = score_resume(text, jd_state, candidate_id, scorer=_get_scorer(jd_state["text"]))
+    row["path"] = path
+    row["error"] = None
+    return row
+
+# --- Output writers: write(row) / close() return the paths that are now on disk ---
+# append=False starts a fresh output; append=True continues a checkpointed run (--resume)
+class JsonlWriter:
+    def __init__(self, path, append=False):
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, row):
+        self._file.write(json.dumps(row) + "\n")
+        self._file.flush()
+        return [row["path"]]
+
+    def close(self):
+        self._file.close()
+        return []
+
+class CsvWriter:
+    def __init__(self, path, append=False):
+        new_file = not append or not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "w" if new_file else "a", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=FIELDS, extrasaction="ignore")
+        if new_file:
+            self._writer.writeheader()
+
+    def write(self, row):
+        row = dict(row)
+        for field in LIST_FIELDS:
+            row[field] = ";".join(sorted(row.get(field) or []))
+        self._writer.writerow(row)
+        self._file.flush()
+        return [row["path"]]
+
+    def close(self):
+        self._file.close()
+        return []
+
+class ParquetWriter:
+    """Writes `path` as a directory of part files, one per `rows_per_part` rows."""
+
+    def __init__(self, path, append=False, rows_per_part=10000):
+        import pandas  # noqa: F401  (fail fast if the Parquet stack is missing)
+
+        os.makedirs(path, exist_ok=True)
+        parts = sorted(n for n in os.listdir(path) if n.startswith("part-") and n.endswith(".parquet"))
+        if not append:
+            for name in parts:
+                os.remove(os.path.join(path, name))
+            parts = []
+        self.path = path
+        self.rows_per_part = rows_per_part
+        self._rows = []
+        self._part = len(parts)
+
+    def write(self, row):
+        self._rows.append({field: row.get(field) for field in FIELDS})
+        return self._flush() if len(self._rows) >= self.rows_per_part else []
+
+    def _flush(self):
+        import pandas as pd
+
+        if not self._rows:
+            return []
+        part_path = os.path.join(self.path, f"part-{self._part:05d}.parquet")
+        pd.DataFrame(self._rows, columns=FIELDS).to_parquet(part_path, index=False)
+        self._part += 1
+        done, self._rows = [row["path"] for row in self._rows], []
+        return done
+
+    def close(self):
+        return self._flush()
+
+WRITERS = {"jsonl": JsonlWriter, "csv": CsvWriter, "parquet": ParquetWriter}
+
+def _expand_inputs(patterns):
+    """Directories and glob patterns -> sorted, de-duplicated resume paths."""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.extend(iter_resume_paths(pattern))
+        else:
+            paths.extend(glob.glob(pattern, recursive=True))
+    return sorted(dict.fromkeys(os.path.abspath(p) for p in paths))
+
+# First checkpoint line: the folder candidate ids are relative to, so resumed runs keep the same ids
+_ROOT_PREFIX = "# root: "
+
+def _load_checkpoint(path):
+    """(root or None, set of finished paths)."""
+    root, done = None, set()
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if line.startswith(_ROOT_PREFIX):
+                    root = line[len(_ROOT_PREFIX):]
+                elif line:
+                    done.add(line)
+    return root, done
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Screen a folder of resumes against a JD.")
+    parser.add_argument("--jd", required=True, help="job description text file")
+    parser.add_argument("--resumes", required=True, nargs="+", help="directories and/or glob patterns")
+    parser.add_argument("--out", required=True, help="output file (JSONL/CSV) or directory (Parquet)")
+    parser.add_argument("--format", choices=sorted(WRITERS), help="default: from --out extension, else jsonl")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=60, help="per-file parse timeout in seconds")
+    parser.add_argument("--resume", action="store_true", help="skip resumes recorded in the checkpoint")
+    parser.add_argument("--checkpoint", help="default: <out>.checkpoint")
+    parser.add_argument("--root", help="folder candidate ids are relative to "
+                                       "(default: the folder all inputs share, kept in the checkpoint)")
+    args = parser.parse_args(argv)
+
+    out_format = args.format or os.path.splitext(args.out)[1].lstrip(".").lower()
+    if out_format not in WRITERS:
+        out_format = "jsonl"
+    checkpoint_path = args.checkpoint or args.out.rstrip("/\\") + ".checkpoint"
+
+    with open(args.jd, encoding="utf-8") as f:
+        jd_state = prepare_jd(f.read())
+
+    paths = _expand_inputs(args.resumes)
+    # Ids are relative to --root, else the root recorded by the run being resumed,
+    # else the folder all inputs share (then recorded in the checkpoint)
+    root = os.path.abspath(args.root) if args.root else None
+    if args.resume:
+        saved_root, done = _load_checkpoint(checkpoint_path)
+        root = root or saved_root
+    elif os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    if root is None:
+        root = os.path.commonpath([os.path.dirname(p) for p in paths]) if paths else os.getcwd()
+    if args.resume:
+        paths = [p for p in paths if p not in done]
+    print(f"Screening {len(paths)} resumes for role '{jd_state['role']}' -> {args.out} ({out_format})", file=sys.stderr)
+
+    writer = WRITERS[out_format](args.out, append=args.resume)
+    processed = 0
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+        if checkpoint.tell() == 0:
+            checkpoint.write(_ROOT_PREFIX + root + "\n")
+
+        def commit(durable_paths):
+            # A path is checkpointed only once its row is on disk
+            for path in durable_paths:
+                checkpoint.write(path + "\n")
+            checkpoint.flush()
+
+        try:
+            for path, row, error in run_in_pool(_screen_file, paths, args.workers, jd_state, args.timeout, root):
+                if error is not None:
+                    row = {"path": path, "candidate_id": _candidate_id(path, root), "error": error}
+                commit(writer.write(row))
+                processed += 1
+                if processed % 1000 == 0:
+                    print(f"  {processed}/{len(paths)} done", file=sys.stderr)
+        finally:
+            commit(writer.close())
+
+    print(f"Done: {processed} resumes screened.", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# app/service.py
+# HTTP scoring service (runs alongside the Streamlit UI):
+#   uvicorn app.service:app --host 0.0.0.0 --port 8000
+import sys
+import os
+import asyncio
+import re
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse, Response
+from pydantic import BaseModel
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from embeddings.batch_screener import prepare_jd, score_resume, screen_batch
+from generation.recommendation_generator import generate_recommendations
+from app.utils import create_pdf_report
+from monitoring.metrics import REGISTRY, timed, profile_request
+
+API_WORKERS = int(os.environ.get("CAREERVANTAGE_API_WORKERS", os.cpu_count() or 1))
+# Profiles kept for GET /profiles/{id} (oldest dropped first)
+MAX_PROFILES = int(os.environ.get("CAREERVANTAGE_MAX_PROFILES", 50))
+PROFILE_HEADER = "X-CareerVantage-Profile"
+
+class ScoreRequest(BaseModel):
+    resume_text: str
+    jd_text: str
+
+class BatchScoreRequest(BaseModel):
+    jd_text: str
+    resumes: Dict[str, str]
+    top_k: Optional[int] = None
+
+class ReportRequest(BaseModel):
+    name: str = "Candidate"
+    resume_text: str
+    jd_text: str
+
+# --- CPU-bound work (runs in the process pool) ---
+def _score_one(resume_text, jd_text):
+    result = score_resume(resume_text, prepare_jd(jd_text))
+    result["ai_advice"] = generate_recommendations(result["missing_skills"], result["role"])
+    return result
+
+def _score_many(jd_text, resumes, top_k):
+    results = screen_batch(jd_text, resumes)
+    return results[:top_k] if top_k else results
+
+def _render_report(name, resume_text, jd_text):
+    result = _score_one(resume_text, jd_text)
+    return create_pdf_report(name, result["ats_score"], result["role"], result["missing_skills"],
+                             result["ai_advice"], result["resume_skills"], result["required_skills"])
+
+# --- Worker side: stage metrics (and optional profiles) travel back with each result ---
+def _init_worker():
+    # A forked worker starts with a copy of the parent's metrics; only ship its own
+    REGISTRY.reset()
+
+def _run_in_worker(fn, args, profile):
+    """Returns (result, error, metrics delta, profile report) so stage timers reach the parent."""
+    report = None
+    try:
+        if profile:
+            with profile_request() as capture:
+                result = fn(*args)
+            report = capture.to_dict()
+        else:
+            result = fn(*args)
+        error = None
+    except Exception as e:
+        result, error = None, e
+    return result, error, REGISTRY.drain(), report
+
+@asynccontextmanager
+async def lifespan(app):
+    app.state.pool = ProcessPoolExecutor(max_workers=API_WORKERS, initializer=_init_worker)
+    app.state.profiles = OrderedDict()
+    yield
+    app.state.pool.shutdown()
+
+app = FastAPI(title="CareerVantage Scoring API", lifespan=lifespan)
+
+async def _offload(headers, profile, fn, *args):
+    # The event loop only awaits; parsing/scoring/rendering happen in worker processes.
+    # Their stage metrics are merged into the exported registry when each call returns.
+    with timed("api" + fn.__name__):
+        result, error, metrics, report = await asyncio.get_running_loop().run_in_executor(
+            app.state.pool, _run_in_worker, fn, args, profile
+        )
+    REGISTRY.merge(metrics)
+    if report is not None:
+        profile_id = uuid.uuid4().hex
+        app.state.profiles[profile_id] = report
+        while len(app.state.profiles) > MAX_PROFILES:
+            app.state.profiles.popitem(last=False)
+        headers[PROFILE_HEADER] = profile_id
+    if error is not None:
+        raise error
+    return result
+
+# ?profile=1 on any endpoint profiles that request (cProfile + tracemalloc, adds overhead);
+# the report id comes back in the X-CareerVantage-Profile header, see GET /profiles/{id}.
+@app.post("/score")
+async def score(request: ScoreRequest, response: Response, profile: bool = False):
+    return await _offload(response.headers, profile, _score_one, request.resume_text, request.jd_text)
+
+@app.post("/score/batch")
+async def score_batch(request: BatchScoreRequest, response: Response, profile: bool = False) -> List[dict]:
+    return await _offload(response.headers, profile, _score_many, request.jd_text, request.resumes, request.top_k)
+
+@app.post("/report")
+async def report(request: ReportRequest, profile: bool = False):
+    headers = {"Content-Disposition": _content_disposition(request.name)}
+    pdf_bytes = await _offload(headers, profile, _render_report, request.name, request.resume_text, request.jd_text)
+    return Response(pdf_bytes, media_type="application/pdf", headers=headers)
+
+def _content_disposition(name):
+    # Headers are latin-1: ASCII-only fallback name plus the RFC 5987 UTF-8 form for non-ASCII names
+    file_name = f"{name}_CareerVantage_Report.pdf"
+    fallback = re.sub(r"[^\w.-]", "_", file_name, flags=re.ASCII)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(file_name.replace(' ', '_'), safe='')}"
+
+@app.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str):
+    report = app.state.profiles.get(profile_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired profile id")
+    return report
+
+@app.get("/metrics")
+async def metrics():
+    return PlainTextResponse(REGISTRY.to_prometheus(), media_type="text/plain; version=0.0.4")
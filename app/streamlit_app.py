@@ -7,9 +7,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import custom modules
 try:
-    from preprocessing.resume_parser import extract_resume_text
+    from preprocessing.resume_cache import ResumeCache, parse_resume_bytes, resume_digest
     from preprocessing.jd_parser import extract_jd_text
-    from embeddings.skill_extractor import identify_missing_skills
+    from embeddings.skill_extractor import compare_skills
+    from embeddings.batch_screener import prepare_jd
     from embeddings.similarity_engine import calculate_ats_score
     from generation.recommendation_generator import generate_recommendations
     from app.utils import create_pdf_report
@@ -17,6 +18,41 @@ except ImportError as e:
     st.error(f"Import Error: {e}. Please check your folder structure and file names.")
     st.stop()
 
+# --- Cached Pipeline Stages ---
+# Streamlit re-runs this script on every interaction, so the heavy stages are
+# cached by the uploaded file's hash and the JD text.
+@st.cache_resource
+def get_resume_cache():
+    return ResumeCache(max_entries=512)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def get_jd_state(jd_text):
+    return prepare_jd(jd_text)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def run_analysis(resume_sha256, jd_text, _resume_bytes):
+    # _resume_bytes is not hashed by Streamlit; resume_sha256 is the cache key
+    parsed = parse_resume_bytes(_resume_bytes, cache=get_resume_cache())
+    if not parsed["text"].strip():
+        return None
+
+    jd_state = get_jd_state(jd_text)
+    missing, kw_score = compare_skills(parsed["skills"], jd_state["skills"])
+    raw_ats_score = calculate_ats_score(parsed["text"], jd_state["text"], kw_score)
+
+    return {
+        "ats_score": max(0.0, min(float(raw_ats_score), 1.0)),
+        "role": jd_state["role"],
+        "missing": missing,
+        "resume_skills": list(parsed["skills"]),
+        "required_skills": list(jd_state["skills"]),
+        "ai_advice": generate_recommendations(missing, jd_state["role"]),
+    }
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_report(name, ats_score, role, missing, ai_advice, resume_skills, required_skills):
+    return create_pdf_report(name, ats_score, role, list(missing), ai_advice, resume_skills, required_skills)
+
 # --- Page Configuration ---
 st.set_page_config(
     page_title="CareerVantage",
@@ -140,7 +176,7 @@ st.markdown("<br>", unsafe_allow_html=True)
 col1, col2 = st.columns([1, 1], gap="large")
 with col1:
     st.markdown("### 📄 Upload Resume")
-    resume_file = st.file_uploader("Upload your PDF resume", type=["pdf"], label_visibility="collapsed")
+    resume_file = st.file_uploader("Upload your resume (PDF, DOCX, TXT or HTML)", type=["pdf", "docx", "txt", "html", "htm"], label_visibility="collapsed")
 with col2:
     st.markdown("### 💼 Job Description")
     jd_input = st.text_area("Paste JD text here", height=150, placeholder="Paste the job description...", label_visibility="collapsed")
@@ -166,21 +202,21 @@ if analyze_btn:
 
         with st.spinner(f"Running AI Analysis for {final_name}..."):
             try:
-                # 1. Parsing
-                resume_text = extract_resume_text(resume_file)
+                # 1. Parsing, Skill Extraction, Scoring & Recommendations (cached)
+                resume_bytes = resume_file.getvalue()
                 jd_text = extract_jd_text(jd_input)
+                analysis = run_analysis(resume_digest(resume_bytes), jd_text, resume_bytes)
 
-                if not resume_text.strip():
-                    st.error("Error: The Resume PDF appears empty.")
+                if analysis is None:
+                    st.error("Error: The Resume appears empty.")
                     st.stop()
 
-                # 2. Skill Extraction & Scoring
-                resume_skills, required_skills, missing, kw_score, role = identify_missing_skills(resume_text, jd_text)
-                raw_ats_score = calculate_ats_score(resume_text, jd_text, kw_score)
-                ats_score = max(0.0, min(float(raw_ats_score), 1.0))
-                
-                # 3. AI Recommendations
-                ai_advice = generate_recommendations(missing, role)
+                ats_score = analysis["ats_score"]
+                role = analysis["role"]
+                missing = analysis["missing"]
+                resume_skills = analysis["resume_skills"]
+                required_skills = analysis["required_skills"]
+                ai_advice = analysis["ai_advice"]
                 
             except Exception as e:
                 st.error(f"An error occurred: {e}")
@@ -246,11 +282,8 @@ if analyze_btn:
         
         # 4. PDF REPORT
         # Make sure your create_pdf_report function in app/utils.py accepts these new arguments
-        pdf_path = create_pdf_report(final_name, ats_score, role, missing, ai_advice, resume_skills, required_skills)
-        
-        with open(pdf_path, "rb") as f:
-            pdf_bytes = f.read()
-            
+        pdf_bytes = build_report(final_name, ats_score, role, tuple(missing), ai_advice, tuple(resume_skills), tuple(required_skills))
+
         st.download_button(
             label="📥 Download Professional Report (PDF)",
             data=pdf_bytes,
@@ -1,8 +1,11 @@
 import sys
 import os
+import io
 import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from fpdf import FPDF
-import tempfile
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -13,6 +16,40 @@ except ImportError:
         if not text: return ""
         return text.encode('latin-1', 'replace').decode('latin-1')
 
+from generation.recommendation_generator import generate_recommendations
+from monitoring.metrics import timed
+
+# Static table shared by every report
+AUDIT_ITEMS = (
+    ("Contact Info", "Ensure email & phone are clearly visible at top."),
+    ("Section Headers", "Use standard titles (Experience, Skills, Education)."),
+    ("Bullet Points", "Start every bullet with a strong action verb."),
+    ("File Format", "PDF is preferred over Word/Text."),
+    ("Spelling", "Zero typos allowed. Use Grammarly/Spellcheck.")
+)
+
+@lru_cache(maxsize=512)
+def _parse_feedback(ai_feedback):
+    """
+    Splits the recommendation markdown into (style, cleaned line) pairs.
+    Memoized: candidates with the same role/gaps share the same feedback text.
+    """
+    # Clean Links
+    clean_fb = re.sub(r"\[(.*?)\]\((.*?)\)", r"\1: \2", ai_feedback)
+    lines = [line.strip() for line in clean_fb.split('\n')]
+    parsed = []
+    # Per line: feedback is a dozen short, mostly ASCII lines, where the batch cleaner only adds overhead
+    for clean_line in (clean_text_for_pdf(line) for line in lines if line):
+        if "Recommended" in clean_line or "Internship" in clean_line or "Portfolio" in clean_line:
+            parsed.append(("heading", clean_line.replace('#', '').strip()))
+        elif clean_line.startswith(('1.', '2.', '3.')):
+            parsed.append(("numbered", clean_line))
+        elif clean_line.startswith('-'):
+            parsed.append(("bullet", "  " + clean_line))
+        else:
+            parsed.append(("text", clean_line))
+    return tuple(parsed)
+
 class PDFReport(FPDF):
     def header(self):
         self.set_font('Arial', 'B', 16)
@@ -34,8 +71,14 @@ class PDFReport(FPDF):
         self.multi_cell(0, 5, clean_text)
         self.ln(1)
 
-def create_pdf_report(name, ats_score, role, missing_skills, ai_feedback, resume_skills, required_skills):
+def build_pdf_report(name, ats_score, role, missing_skills, ai_feedback, resume_skills, required_skills):
+    """Lays out the full report and returns the (unrendered) PDFReport."""
     pdf = PDFReport()
+    _add_candidate_report(pdf, name, ats_score, role, missing_skills, ai_feedback, resume_skills, required_skills)
+    return pdf
+
+def _add_candidate_report(pdf, name, ats_score, role, missing_skills, ai_feedback, resume_skills, required_skills):
+    """Appends one candidate's report (starting on a new page) to `pdf`."""
     pdf.add_page()
 
     # --- 1. CANDIDATE PROFILE TABLE ---
@@ -108,24 +151,15 @@ def create_pdf_report(name, ats_score, role, missing_skills, ai_feedback, resume
     # --- 3. STRATEGY ---
     pdf.section_title("3. Strategic Roadmap")
     if ai_feedback:
-        # Clean Links
-        clean_fb = re.sub(r"\[(.*?)\]\((.*?)\)", r"\1: \2", str(ai_feedback))
-        lines = clean_fb.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line: continue
-            
-            clean_line = clean_text_for_pdf(line)
-            if "Recommended" in clean_line or "Internship" in clean_line or "Portfolio" in clean_line:
+        for style, clean_line in _parse_feedback(str(ai_feedback)):
+            if style == "heading":
                 pdf.ln(3)
                 pdf.set_font('Arial', 'B', 11)
                 pdf.set_fill_color(230, 230, 230)
-                pdf.cell(0, 8, clean_line.replace('#', '').strip(), 0, 1, 'L', 1)
-            elif clean_line.startswith(('1.', '2.', '3.')):
+                pdf.cell(0, 8, clean_line, 0, 1, 'L', 1)
+            elif style == "numbered":
                 pdf.ln(2)
                 pdf.body_text(clean_line, is_bold=True)
-            elif clean_line.startswith('-'):
-                pdf.body_text("  " + clean_line)
             else:
                 pdf.body_text(clean_line)
     
@@ -141,17 +175,8 @@ def create_pdf_report(name, ats_score, role, missing_skills, ai_feedback, resume
     pdf.cell(50, 8, "Checklist Item", 1, 0, 'L', 1)
     pdf.cell(140, 8, "Action Required", 1, 1, 'L', 1)
     
-    # Audit Table Body
-    audit_items = [
-        ("Contact Info", "Ensure email & phone are clearly visible at top."),
-        ("Section Headers", "Use standard titles (Experience, Skills, Education)."),
-        ("Bullet Points", "Start every bullet with a strong action verb."),
-        ("File Format", "PDF is preferred over Word/Text."),
-        ("Spelling", "Zero typos allowed. Use Grammarly/Spellcheck.")
-    ]
-    
     pdf.set_font('Arial', '', 10)
-    for item, desc in audit_items:
+    for item, desc in AUDIT_ITEMS:
         # Item Column
         pdf.set_font('Arial', 'B', 10)
         pdf.cell(50, 8, item, 1)
@@ -159,7 +184,95 @@ def create_pdf_report(name, ats_score, role, missing_skills, ai_feedback, resume
         pdf.set_font('Arial', '', 10)
         pdf.cell(140, 8, desc, 1, 1)
 
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    temp_file.close()
-    pdf.output(temp_file.name)
-    return temp_file.name
\ No newline at end of file
+def render_pdf_bytes(pdf):
+    """Renders a finished FPDF document in memory (works with fpdf 1.x and fpdf2)."""
+    data = pdf.output(dest='S')
+    if isinstance(data, str):
+        # fpdf 1.x returns the document as a latin-1 string
+        data = data.encode('latin-1')
+    return bytes(data)
+
+@timed("render_pdf_report")
+def create_pdf_report(name, ats_score, role, missing_skills, ai_feedback, resume_skills, required_skills, output=None):
+    """
+    Builds the report and returns it as PDF bytes. Nothing is written to disk;
+    if `output` (a binary file object) is given the bytes are also written to it.
+    """
+    pdf = build_pdf_report(name, ats_score, role, missing_skills, ai_feedback, resume_skills, required_skills)
+    pdf_bytes = render_pdf_bytes(pdf)
+    if output is not None:
+        output.write(pdf_bytes)
+    return pdf_bytes
+
+# --- BATCH REPORTS ---
+def _report_args(result):
+    """Maps a screening result (see embeddings.batch_screener) to report arguments."""
+    missing = list(result.get("missing_skills", []))
+    role = result.get("role", "General")
+    ai_feedback = result.get("ai_feedback")
+    if ai_feedback is None:
+        ai_feedback = generate_recommendations(missing, role)
+    name = result.get("name") or str(result.get("candidate_id", "Candidate"))
+    return (name, result["ats_score"], role, missing, ai_feedback,
+            result.get("resume_skills", []), result.get("required_skills", []))
+
+def _render_combined_chunk(indexed_results):
+    pdf = PDFReport()
+    for _, result in indexed_results:
+        _add_candidate_report(pdf, *_report_args(result))
+    return render_pdf_bytes(pdf)
+
+def _safe_file_name(name):
+    # Candidate names are user input: no path separators or other specials in ZIP entries (zip-slip)
+    return re.sub(r"[^\w.-]", "_", name)
+
+def _render_zip_chunk(indexed_results):
+    files = []
+    for index, result in indexed_results:
+        args = _report_args(result)
+        file_name = f"{index + 1:05d}_{_safe_file_name(args[0])}_CareerVantage_Report.pdf"
+        files.append((file_name, create_pdf_report(*args)))
+    return files
+
+def _merge_pdfs(parts):
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(io.BytesIO(part))
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+@timed("render_batch_report")
+def create_batch_report(results, mode="combined", workers=None, chunk_size=50):
+    """
+    Renders reports for a whole screening batch.
+
+    mode="combined" returns one PDF (bytes) with a section per candidate;
+    mode="zip" returns a ZIP archive (bytes) with one PDF per candidate.
+    Candidates are rendered in chunks of `chunk_size` across `workers`
+    processes (workers=1 renders in-process).
+    """
+    if mode not in ("combined", "zip"):
+        raise ValueError(f"Unknown batch report mode: {mode!r}")
+
+    indexed = list(enumerate(results))
+    chunks = [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)] or [[]]
+    render_chunk = _render_combined_chunk if mode == "combined" else _render_zip_chunk
+
+    if workers == 1 or len(chunks) == 1:
+        parts = [render_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(render_chunk, chunks))
+
+    if mode == "combined":
+        return parts[0] if len(parts) == 1 else _merge_pdfs(parts)
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for files in parts:
+            for file_name, pdf_bytes in files:
+                archive.writestr(file_name, pdf_bytes)
+    return buffer.getvalue()
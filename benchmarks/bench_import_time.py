@@ -0,0 +1,39 @@
+# benchmarks/bench_import_time.py
+# Measures cold-start cost of the app's modules with the lazy text generator,
+# versus the old behaviour of loading distilgpt2 at import time.
+# Run: python benchmarks/bench_import_time.py
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+APP_IMPORTS = (
+    "import preprocessing.resume_parser, preprocessing.jd_parser, "
+    "embeddings.skill_extractor, embeddings.similarity_engine, "
+    "generation.recommendation_generator, app.utils"
+)
+
+def time_python(code, repeat=3):
+    """Best wall-clock time of running `code` in a fresh interpreter."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    baseline = time_python("pass")
+    lazy = time_python(APP_IMPORTS)
+    # Old behaviour: the pipeline was built as a side effect of importing the module
+    eager = time_python(APP_IMPORTS + "; generation.recommendation_generator.get_generator()")
+
+    print(f"interpreter startup      : {baseline * 1e3:8.1f} ms")
+    print(f"app imports (lazy)       : {lazy * 1e3:8.1f} ms")
+    print(f"app imports (eager model): {eager * 1e3:8.1f} ms")
+    print(f"cold-start saving        : {(eager - lazy) * 1e3:8.1f} ms ({eager / lazy:.1f}x faster)")
+
+if __name__ == "__main__":
+    main()
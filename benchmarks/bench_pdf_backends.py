@@ -0,0 +1,57 @@
+# benchmarks/bench_pdf_backends.py
+# Compares PyPDF2 and pypdf text extraction on a folder of sample PDFs.
+# Run: python benchmarks/bench_pdf_backends.py [pdf_dir]
+# Without a folder, a small synthetic corpus is rendered with fpdf first.
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+BACKENDS = ("PyPDF2", "pypdf")
+
+def make_corpus(directory, n_files=20):
+    from fpdf import FPDF
+    from embeddings.skill_taxonomy import TAXONOMY
+
+    skills = TAXONOMY.skills
+    for i in range(n_files):
+        pdf = FPDF()
+        for page in range(1 + i % 4):
+            pdf.add_page()
+            pdf.set_font("Arial", "", 10)
+            lines = [f"Built systems with {skills[(i + page + j) % len(skills)]} and delivered results." for j in range(40)]
+            pdf.multi_cell(0, 5, "\n".join(lines))
+        pdf.output(os.path.join(directory, f"resume_{i:03d}.pdf"))
+
+def time_backend(module_name, paths, repeat=3):
+    reader_cls = importlib.import_module(module_name).PdfReader
+    best = float("inf")
+    chars = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chars = sum(len("".join(page.extract_text() or "" for page in reader_cls(path).pages)) for path in paths)
+        best = min(best, time.perf_counter() - start)
+    return best, chars
+
+def main():
+    if len(sys.argv) > 1:
+        directory = sys.argv[1]
+    else:
+        directory = tempfile.mkdtemp(prefix="cv_pdf_corpus_")
+        make_corpus(directory)
+    paths = sorted(os.path.join(directory, n) for n in os.listdir(directory) if n.lower().endswith(".pdf"))
+    print(f"corpus: {len(paths)} PDFs in {directory}")
+
+    for backend in BACKENDS:
+        try:
+            seconds, chars = time_backend(backend, paths)
+        except ImportError:
+            print(f"{backend:>7}: not installed")
+            continue
+        print(f"{backend:>7}: {seconds / len(paths) * 1e3:8.2f} ms/file, {chars} chars extracted")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# benchmarks/bench_pdf_report.py
+# Reports/second for the old temp-file round trip vs in-memory rendering.
+# Run: python benchmarks/bench_pdf_report.py
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils import build_pdf_report, create_pdf_report
+from generation.recommendation_generator import generate_recommendations
+
+MISSING = ["docker", "kubernetes", "aws", "terraform"]
+REPORT_ARGS = (
+    "Alex Smith", 0.62, "DevOps Engineer", MISSING,
+    generate_recommendations(MISSING, "DevOps Engineer"),
+    ["python", "linux", "git", "bash"], ["docker", "kubernetes", "aws", "terraform", "linux", "bash"],
+)
+
+def legacy_report_bytes():
+    """The original flow: render to a NamedTemporaryFile, then read it back."""
+    pdf = build_pdf_report(*REPORT_ARGS)
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
+    temp_file.close()
+    pdf.output(temp_file.name)
+    with open(temp_file.name, "rb") as f:
+        data = f.read()
+    os.unlink(temp_file.name)  # the app never did this; done here to keep /tmp clean
+    return data
+
+def reports_per_second(fn, seconds=3.0):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+def main():
+    legacy = reports_per_second(legacy_report_bytes)
+    in_memory = reports_per_second(lambda: create_pdf_report(*REPORT_ARGS))
+    print(f"temp file : {legacy:8.1f} reports/s")
+    print(f"in memory : {in_memory:8.1f} reports/s ({in_memory / legacy:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_role_detection.py
+# Latency of single-pass role detection vs the original substring scan, plus a
+# consistency check that role scores agree with extract_skills output.
+# Run: python benchmarks/bench_role_detection.py
+import os
+import random
+import sys
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from embeddings.skill_extractor import (
+    SKILL_CATEGORIES, ALL_SKILLS, CONTEXT_TERMS, detect_job_role, extract_skills, score_job_roles
+)
+
+FILLER = "we are hiring a motivated engineer to join our team and deliver results with".split()
+
+def legacy_detect_job_role(jd_text):
+    """The original implementation: raw substring checks per role and skill."""
+    jd_text = jd_text.lower()
+    role_scores = {role: sum(1 for skill in skills if skill in jd_text) for role, skills in SKILL_CATEGORIES.items()}
+    if "school" in jd_text or "k-12" in jd_text or "grade" in jd_text:
+        role_scores["School Teacher"] += 5
+    elif "college" in jd_text or "university" in jd_text or "professor" in jd_text:
+        role_scores["Engineering Lecturer"] += 3
+        role_scores["PUC Lecturer"] += 3
+    elif "hospital" in jd_text or "clinic" in jd_text or "patient" in jd_text:
+        role_scores["Doctor"] += 5
+    elif "lab" in jd_text or "experiment" in jd_text:
+        role_scores["Scientist"] += 3
+    if max(role_scores.values()) == 0:
+        return "Software Developer"
+    return max(role_scores, key=role_scores.get)
+
+def make_jd(rng, n_words=300):
+    role = rng.choice(sorted(SKILL_CATEGORIES))
+    role_skills = sorted(SKILL_CATEGORIES[role])
+    other_skills = sorted(ALL_SKILLS)
+    words = []
+    for _ in range(n_words):
+        roll = rng.random()
+        words.append(rng.choice(role_skills) if roll < 0.08 else rng.choice(other_skills) if roll < 0.1 else rng.choice(FILLER))
+    return " ".join(words)
+
+def check_consistency(jds):
+    """Without context words, each role's score is exactly |extract_skills(jd) & role skills|."""
+    checked = [jd for jd in jds if CONTEXT_TERMS.isdisjoint(jd.split())]
+    for jd in checked:
+        skills = extract_skills(jd)
+        scores = score_job_roles(jd)
+        for role, role_skills in SKILL_CATEGORIES.items():
+            assert scores[role] == len(skills & role_skills), (role, jd)
+    return len(checked)
+
+def main():
+    rng = random.Random(0)
+    jds = [make_jd(rng) for _ in range(200)]
+    checked = check_consistency(jds)
+    print(f"consistency: role scores match extract_skills on {checked} JDs without context words")
+
+    legacy = min(timeit.repeat(lambda: [legacy_detect_job_role(jd) for jd in jds], number=5, repeat=3)) / (5 * len(jds))
+    single = min(timeit.repeat(lambda: [detect_job_role(jd) for jd in jds], number=5, repeat=3)) / (5 * len(jds))
+    agree = sum(legacy_detect_job_role(jd) == detect_job_role(jd) for jd in jds)
+    print(f"substring scan : {legacy * 1e6:8.1f} us/JD")
+    print(f"single pass    : {single * 1e6:8.1f} us/JD ({legacy / single:.1f}x)")
+    print(f"same role as legacy on {agree}/{len(jds)} JDs (differences come from substring false positives)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# benchmarks/bench_skill_extractor.py
+# Compares the compiled single-pass matcher against the original per-skill regex loop.
+# Run: python benchmarks/bench_skill_extractor.py
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from embeddings.skill_extractor import ALL_SKILLS, extract_skills
+
+FILLER = "experience team project delivered built managed worked with using and the of in for".split()
+
+def legacy_extract_skills(text):
+    """The original implementation: one fresh regex search per skill."""
+    text = text.lower()
+    return {s for s in ALL_SKILLS if re.search(r"\b" + re.escape(s) + r"\b", text)}
+
+def make_document(size, seed=0):
+    rng = random.Random(seed)
+    skills = sorted(ALL_SKILLS)
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(skills) if rng.random() < 0.1 else rng.choice(FILLER)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+def main():
+    print(f"{'size':>8} {'legacy (ms)':>12} {'compiled (ms)':>14} {'speedup':>8}")
+    for size in (1_000, 10_000, 100_000):
+        doc = make_document(size)
+        assert extract_skills(doc) == legacy_extract_skills(doc)
+        runs = max(3, 2_000_000 // size)
+        legacy = min(timeit.repeat(lambda: legacy_extract_skills(doc), number=runs, repeat=3)) / runs
+        compiled = min(timeit.repeat(lambda: extract_skills(doc), number=runs, repeat=3)) / runs
+        print(f"{size // 1000:>6}KB {legacy * 1e3:>12.3f} {compiled * 1e3:>14.3f} {legacy / compiled:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
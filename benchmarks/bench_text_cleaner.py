@@ -0,0 +1,67 @@
+# benchmarks/bench_text_cleaner.py
+# Throughput of the text cleaners: original per-call versions vs the current
+# single-call and batch variants.
+# Run: python benchmarks/bench_text_cleaner.py
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from preprocessing.text_cleaner import (
+    clean_text_for_pdf, clean_text_for_analysis, clean_texts_for_pdf, clean_texts_for_analysis
+)
+
+def legacy_clean_text_for_pdf(text):
+    if not text:
+        return ""
+    replacements = {
+        u'\u201c': '"', u'\u201d': '"', u'\u2018': "'", u'\u2019': "'",
+        u'\u2013': '-', u'\u2014': '-', u'\u2022': '*',
+    }
+    for search, replace in replacements.items():
+        text = text.replace(search, replace)
+    return text.encode('latin-1', 'replace').decode('latin-1')
+
+def legacy_clean_text_for_analysis(text):
+    if not text:
+        return ""
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+PDF_LINES = [
+    "- **PYTHON**: [View Course](https://www.coursera.org/specializations/python)",
+    "### \U0001F4DA Recommended Coursera Certifications:",
+    "**Strategy:** Apply for ‘SDE Intern’ roles — or contribute to Open Source.",
+    "1. Beginner: Task CLI - Build a command-line To-Do list manager in Python/Java.",
+]
+
+def throughput(fn, items, seconds=2.0):
+    """Items processed per second."""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn(items)
+        count += len(items)
+    return count / (time.perf_counter() - start)
+
+def main():
+    rng = random.Random(0)
+    lines = [rng.choice(PDF_LINES) for _ in range(10_000)]
+    docs = [" \n ".join(rng.choice(PDF_LINES) for _ in range(40)) + "\n\n\t" for _ in range(2_000)]
+
+    rows = [
+        ("pdf lines   legacy", lambda xs: [legacy_clean_text_for_pdf(t) for t in xs], lines),
+        ("pdf lines   single", lambda xs: [clean_text_for_pdf(t) for t in xs], lines),
+        ("pdf lines   batch ", clean_texts_for_pdf, lines),
+        ("analysis    legacy", lambda xs: [legacy_clean_text_for_analysis(t) for t in xs], docs),
+        ("analysis    single", lambda xs: [clean_text_for_analysis(t) for t in xs], docs),
+        ("analysis    batch ", clean_texts_for_analysis, docs),
+    ]
+    for label, fn, items in rows:
+        print(f"{label}: {throughput(fn, items):>12,.0f} items/s")
+
+if __name__ == "__main__":
+    main()
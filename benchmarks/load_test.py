@@ -0,0 +1,69 @@
+# benchmarks/load_test.py
+# Local load test for app/service.py. Start the service first:
+#   uvicorn app.service:app --port 8000
+# Run: python benchmarks/load_test.py [--endpoint /score] [--requests 500] [--concurrency 32]
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+RESUME = ("Data analyst with 3 years of experience in python, sql, pandas and tableau. "
+          "Built excel dashboards and etl pipelines; strong statistics background.")
+JD = ("We are hiring a Data Analyst skilled in sql, python, power bi, snowflake, statistics "
+      "and data visualization to support our analytics team.")
+
+PAYLOADS = {
+    "/score": {"resume_text": RESUME, "jd_text": JD},
+    "/score/batch": {"jd_text": JD, "resumes": {str(i): RESUME for i in range(50)}, "top_k": 10},
+    "/report": {"name": "Load Test", "resume_text": RESUME, "jd_text": JD},
+}
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def send(url, body):
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            ok = response.status == 200
+    except urllib.error.HTTPError as e:
+        # Non-2xx responses are counted as errors, not fatal to the run
+        e.read()
+        ok = False
+    except (urllib.error.URLError, OSError):
+        ok = False
+    return time.perf_counter() - start, ok
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the CareerVantage scoring API")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--endpoint", default="/score", choices=sorted(PAYLOADS))
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    body = json.dumps(PAYLOADS[args.endpoint]).encode("utf-8")
+    url = args.url + args.endpoint
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(lambda _: send(url, body), range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    errors = sum(1 for _, ok in results if not ok)
+    print(f"{args.endpoint}: {args.requests} requests, concurrency {args.concurrency}, errors {errors}")
+    print(f"p50 {percentile(latencies, 50) * 1e3:.1f} ms | p95 {percentile(latencies, 95) * 1e3:.1f} ms | "
+          f"p99 {percentile(latencies, 99) * 1e3:.1f} ms | {args.requests / elapsed:.1f} req/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# benchmarks/run_benchmarks.py
+# Times each screening stage separately and end to end on a synthetic corpus,
+# and writes JSON that can be compared between commits.
+# Run: python benchmarks/run_benchmarks.py --out results.json [--compare baseline.json]
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic_corpus import make_corpus
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# name -> fn(corpus) -> number of items processed
+STAGES = {}
+
+def stage(name):
+    def decorator(fn):
+        STAGES[name] = fn
+        return fn
+    return decorator
+
+@stage("extract_skills")
+def bench_extract_skills(corpus):
+    from embeddings.skill_extractor import extract_skills
+    for text in corpus["resumes"]:
+        extract_skills(text)
+    return len(corpus["resumes"])
+
+@stage("detect_job_role")
+def bench_detect_job_role(corpus):
+    from embeddings.skill_extractor import detect_job_role
+    for jd in corpus["jds"]:
+        detect_job_role(jd)
+    return len(corpus["jds"])
+
+@stage("identify_missing_skills")
+def bench_identify_missing_skills(corpus):
+    from embeddings.skill_extractor import identify_missing_skills
+    jd = corpus["jds"][0]
+    for text in corpus["resumes"]:
+        identify_missing_skills(text, jd)
+    return len(corpus["resumes"])
+
+@stage("calculate_ats_score")
+def bench_calculate_ats_score(corpus):
+    from embeddings.similarity_engine import calculate_ats_score
+    jd = corpus["jds"][0]
+    for text in corpus["resumes"]:
+        calculate_ats_score(text, jd, 0.5)
+    return len(corpus["resumes"])
+
+@stage("ats_scorer_batch")
+def bench_ats_scorer_batch(corpus):
+    from embeddings.similarity_engine import ATSScorer
+    ATSScorer(corpus["jds"][0]).score_batch(corpus["resumes"], [0.5] * len(corpus["resumes"]))
+    return len(corpus["resumes"])
+
+@stage("generate_recommendations")
+def bench_generate_recommendations(corpus):
+    from generation.recommendation_generator import generate_recommendations
+    for i, role in enumerate(corpus["resume_roles"]):
+        generate_recommendations(["docker", "aws", "sql"][: i % 4], role)
+    return len(corpus["resume_roles"])
+
+@stage("create_pdf_report")
+def bench_create_pdf_report(corpus):
+    from app.utils import create_pdf_report
+    from generation.recommendation_generator import generate_recommendations
+    n = min(50, len(corpus["resumes"]))
+    for role in corpus["resume_roles"][:n]:
+        missing = ["docker", "aws"]
+        create_pdf_report("Bench Candidate", 0.6, role, missing, generate_recommendations(missing, role),
+                          ["python", "sql"], ["python", "sql", "docker", "aws"])
+    return n
+
+@stage("end_to_end_single")
+def bench_end_to_end_single(corpus):
+    """The Streamlit flow, once per resume."""
+    from embeddings.skill_extractor import identify_missing_skills
+    from embeddings.similarity_engine import calculate_ats_score
+    from generation.recommendation_generator import generate_recommendations
+    jd = corpus["jds"][0]
+    n = min(200, len(corpus["resumes"]))
+    for text in corpus["resumes"][:n]:
+        _, _, missing, kw_score, role = identify_missing_skills(text, jd)
+        calculate_ats_score(text, jd, kw_score)
+        generate_recommendations(missing, role)
+    return n
+
+@stage("end_to_end_batch")
+def bench_end_to_end_batch(corpus):
+    from embeddings.batch_screener import screen_batch
+    screen_batch(corpus["jds"][0], corpus["resumes"])
+    return len(corpus["resumes"])
+
+# Memoized helpers (module, function); cleared before every repeat so
+# best-of-N still measures a cold cache rather than only cache hits
+CACHES = (
+    ("generation.recommendation_generator", "_course_line"),
+    ("generation.recommendation_generator", "_render_recommendations"),
+    ("app.utils", "_parse_feedback"),
+)
+
+def clear_caches():
+    for module, name in CACHES:
+        # Only modules a stage has already imported hold anything to clear
+        if module in sys.modules:
+            getattr(sys.modules[module], name).cache_clear()
+
+def run_stage(fn, corpus, repeat):
+    best = float("inf")
+    items = 0
+    for _ in range(repeat):
+        clear_caches()
+        start = time.perf_counter()
+        items = fn(corpus)
+        best = min(best, time.perf_counter() - start)
+    return {"items": items, "seconds": best, "per_item_us": best / max(items, 1) * 1e6}
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(current, baseline):
+    print(f"\n{'stage':<28} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    for name, result in current["stages"].items():
+        old = baseline.get("stages", {}).get(name, {})
+        if "per_item_us" in result and "per_item_us" in old:
+            ratio = result["per_item_us"] / old["per_item_us"]
+            print(f"{name:<28} {old['per_item_us']:>12.1f} {result['per_item_us']:>12.1f} {ratio:>7.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="CareerVantage pipeline benchmarks")
+    parser.add_argument("--resumes", type=int, default=1000)
+    parser.add_argument("--jds", type=int, default=10)
+    parser.add_argument("--noise", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stages", nargs="*", choices=sorted(STAGES), help="subset of stages to run")
+    parser.add_argument("--out", help="write JSON results here")
+    parser.add_argument("--compare", help="baseline JSON results to compare against")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.resumes, args.jds, noise=args.noise, seed=args.seed)
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "params": {"resumes": args.resumes, "jds": args.jds, "noise": args.noise,
+                   "repeat": args.repeat, "seed": args.seed},
+        "stages": {},
+    }
+
+    for name in args.stages or STAGES:
+        try:
+            result = run_stage(STAGES[name], corpus, args.repeat)
+        except ImportError as e:
+            result = {"skipped": f"{type(e).__name__}: {e}"}
+            print(f"{name:<28} skipped ({e})")
+        else:
+            print(f"{name:<28} {result['per_item_us']:>10.1f} us/item  ({result['items']} items)")
+        results["stages"][name] = result
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# benchmarks/synthetic_corpus.py
+# Synthetic resumes / JDs generated from the skill taxonomy (SKILL_CATEGORIES).
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from embeddings.skill_taxonomy import SKILL_CATEGORIES
+
+FILLER = (
+    "experience team project delivered built managed worked with using and the of in for "
+    "responsible led improved designed supported stakeholders across multiple results"
+).split()
+
+def make_document(rng, role, n_words=200, skill_rate=0.08, noise=0.3):
+    """
+    One document for `role`: `skill_rate` of the words are skills, of which a
+    `noise` fraction is drawn from other roles; the rest is filler text.
+    """
+    role_skills = sorted(SKILL_CATEGORIES[role])
+    all_skills = sorted(set().union(*SKILL_CATEGORIES.values()))
+    words = []
+    for _ in range(n_words):
+        if rng.random() < skill_rate:
+            words.append(rng.choice(all_skills if rng.random() < noise else role_skills))
+        else:
+            words.append(rng.choice(FILLER))
+    return " ".join(words)
+
+def pick_role(rng, role_mix=None):
+    """A role drawn uniformly, or by the weights in `role_mix` ({role: weight})."""
+    if not role_mix:
+        return rng.choice(sorted(SKILL_CATEGORIES))
+    roles = sorted(role_mix)
+    return rng.choices(roles, weights=[role_mix[r] for r in roles])[0]
+
+def make_corpus(n_resumes=1000, n_jds=10, role_mix=None, noise=0.3, resume_words=300, jd_words=150, seed=0):
+    """Returns {"resumes": [...], "jds": [...], "resume_roles": [...], "jd_roles": [...]}."""
+    rng = random.Random(seed)
+    resume_roles = [pick_role(rng, role_mix) for _ in range(n_resumes)]
+    jd_roles = [pick_role(rng, role_mix) for _ in range(n_jds)]
+    return {
+        "resumes": [make_document(rng, role, resume_words, 0.08, noise) for role in resume_roles],
+        "jds": [make_document(rng, role, jd_words, 0.15, noise / 3) for role in jd_roles],
+        "resume_roles": resume_roles,
+        "jd_roles": jd_roles,
+    }
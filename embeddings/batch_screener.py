@@ -0,0 +1,104 @@
+# embeddings/batch_screener.py
+from preprocessing.jd_parser import extract_jd_text
+from embeddings.skill_extractor import extract_skills, analyze_jd, compare_skills
+from embeddings.similarity_engine import calculate_ats_score, ATSScorer
+from embeddings.candidate_index import shortlist_candidates
+from monitoring.metrics import timed
+
+def prepare_jd(jd_text):
+    """
+    Does all per-JD work once (parsing, role detection, skill extraction)
+    so it can be reused for every resume in a batch.
+    """
+    jd_text = extract_jd_text(jd_text)
+    jd_skills, role = analyze_jd(jd_text)
+    return {
+        "text": jd_text,
+        "role": role,
+        "skills": jd_skills,
+    }
+
+def score_resume(resume_text, jd_state, candidate_id=None, scorer=None):
+    """
+    Scores one resume against a JD prepared by prepare_jd(). Pass an
+    ATSScorer for that JD when scoring many resumes one at a time; without
+    it, calculate_ats_score refits a vectorizer for every call.
+    """
+    resume_skills = extract_skills(resume_text)
+    missing, kw_score = compare_skills(resume_skills, jd_state["skills"])
+    if scorer is not None:
+        raw_ats_score = scorer.score_batch([resume_text], [kw_score])[0]
+    else:
+        raw_ats_score = calculate_ats_score(resume_text, jd_state["text"], kw_score)
+
+    return {
+        "candidate_id": candidate_id,
+        "ats_score": max(0.0, min(float(raw_ats_score), 1.0)),
+        "keyword_score": kw_score,
+        "role": jd_state["role"],
+        "resume_skills": list(resume_skills),
+        "required_skills": list(jd_state["skills"]),
+        "missing_skills": missing,
+    }
+
+@timed("screen_batch")
+def screen_batch(jd_text, resumes):
+    """
+    Screens one JD against many resumes.
+
+    `resumes` is either a dict {candidate_id: resume_text} or a list of
+    resume texts (the list index is used as candidate_id).
+    Returns the per-candidate results ranked by ATS score (best first).
+    """
+    jd_state = prepare_jd(jd_text)
+    items = resumes.items() if isinstance(resumes, dict) else enumerate(resumes)
+    return _screen_prepared(jd_state, items)
+
+def _screen_prepared(jd_state, items):
+    items = list(items)
+    if not items:
+        return []
+
+    # Skill matching stays per resume; the semantic part is one sparse product
+    results = []
+    for candidate_id, resume_text in items:
+        resume_skills = extract_skills(resume_text)
+        missing, kw_score = compare_skills(resume_skills, jd_state["skills"])
+        results.append({
+            "candidate_id": candidate_id,
+            "ats_score": 0.0,
+            "keyword_score": kw_score,
+            "role": jd_state["role"],
+            "resume_skills": list(resume_skills),
+            "required_skills": list(jd_state["skills"]),
+            "missing_skills": missing,
+        })
+
+    scorer = ATSScorer(jd_state["text"])
+    scores = scorer.score_batch([text for _, text in items], [r["keyword_score"] for r in results])
+    for result, score in zip(results, scores):
+        result["ats_score"] = float(score)
+
+    results.sort(key=lambda r: r["ats_score"], reverse=True)
+    return results
+
+@timed("screen_candidates")
+def screen_candidates(jd_text, skill_index, load_text, shortlist_size=2000, vector_index=None, jd_vector=None):
+    """
+    Two-stage screening for large pools: shortlist candidates from the
+    index (see embeddings.candidate_index), then run the full hybrid score
+    on the shortlist only. `load_text(candidate_id)` returns resume text.
+    """
+    jd_state = prepare_jd(jd_text)
+    shortlist = shortlist_candidates(jd_state["skills"], skill_index, shortlist_size, vector_index, jd_vector)
+    return _screen_prepared(jd_state, _load_texts(shortlist, load_text))
+
+def _load_texts(candidate_ids, load_text):
+    # Candidates can be deleted between shortlisting and loading: skip them
+    for candidate_id in candidate_ids:
+        try:
+            text = load_text(candidate_id)
+        except KeyError:
+            continue
+        if text is not None:
+            yield candidate_id, text
@@ -0,0 +1,123 @@
+# embeddings/candidate_index.py
+from array import array
+import numpy as np
+
+from embeddings.skill_taxonomy import TAXONOMY
+
+class SkillIndex:
+    """
+    Inverted index: skill id -> ids of candidates that have the skill.
+
+    Ranking a JD's candidates by how many of its skills they match is the
+    keyword part (70%) of the ATS score, so it is a cheap, high-recall
+    first stage before the full hybrid scorer.
+    """
+
+    def __init__(self, taxonomy=TAXONOMY):
+        self.taxonomy = taxonomy
+        self.candidate_ids = []
+        self._postings = {}
+
+    def __len__(self):
+        return len(self.candidate_ids)
+
+    def add(self, candidate_id, skills):
+        doc = len(self.candidate_ids)
+        self.candidate_ids.append(candidate_id)
+        for skill in skills:
+            skill_id = self.taxonomy.skill_ids.get(skill)
+            if skill_id is not None:
+                self._postings.setdefault(skill_id, array("i")).append(doc)
+
+    def match_counts(self, jd_skills):
+        """Number of JD skills each candidate has, as an array indexed like candidate_ids."""
+        lists = [np.frombuffer(self._postings[i], dtype=np.int32)
+                 for i in (self.taxonomy.skill_ids.get(s) for s in jd_skills) if i in self._postings]
+        if not lists:
+            return np.zeros(len(self.candidate_ids), dtype=np.int64)
+        return np.bincount(np.concatenate(lists), minlength=len(self.candidate_ids))
+
+    def iter_ids(self):
+        return iter(self.candidate_ids)
+
+    def search(self, jd_skills, limit=2000):
+        """Top `limit` candidates by matched JD skills: [(candidate_id, match_count), ...]."""
+        counts = self.match_counts(jd_skills)
+        hits = np.flatnonzero(counts)
+        if len(hits) > limit:
+            hits = hits[np.argpartition(-counts[hits], limit - 1)[:limit]]
+        hits = hits[np.argsort(-counts[hits], kind="stable")]
+        return [(self.candidate_ids[i], int(counts[i])) for i in hits]
+
+class IVFIndex:
+    """
+    Inverted-file vector index: vectors are bucketed by their nearest k-means
+    centroid, and a query only scans the `n_probe` closest buckets.
+    Vectors are expected to be L2-normalized (dot product == cosine).
+    """
+
+    def __init__(self, n_lists=256, n_probe=8):
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.centroids = None
+        self._ids = []
+        self._vectors = []
+
+    def train(self, vectors, iterations=10, seed=0):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        rng = np.random.default_rng(seed)
+        n_lists = min(self.n_lists, len(vectors))
+        centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(vectors @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = vectors[assignment == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+
+        self.centroids = centroids
+        self._ids = [[] for _ in range(n_lists)]
+        self._vectors = [[] for _ in range(n_lists)]
+
+    def add(self, ids, vectors):
+        if self.centroids is None:
+            raise RuntimeError("IVFIndex.train() must be called before add()")
+        vectors = np.asarray(vectors, dtype=np.float32)
+        for doc_id, vector, c in zip(ids, vectors, np.argmax(vectors @ self.centroids.T, axis=1)):
+            self._ids[c].append(doc_id)
+            self._vectors[c].append(vector)
+
+    def search(self, query, k=2000):
+        """Approximate top-k by cosine: [(id, score), ...] best first."""
+        query = np.asarray(query, dtype=np.float32).ravel()
+        n_probe = min(self.n_probe, len(self.centroids))
+        probe = np.argpartition(-(self.centroids @ query), n_probe - 1)[:n_probe]
+
+        ids = [doc_id for c in probe for doc_id in self._ids[c]]
+        if not ids:
+            return []
+        scores = np.vstack([self._vectors[c] for c in probe if self._vectors[c]]) @ query
+        k = min(k, len(ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(ids[i], float(scores[i])) for i in top]
+
+def shortlist_candidates(jd_skills, skill_index, limit=2000, vector_index=None, jd_vector=None):
+    """
+    Union of the skill-index shortlist and (optionally) the vector-index
+    shortlist, in first-seen order. Returns a list of candidate ids.
+
+    If fewer than `limit` candidates match (e.g. a JD with no taxonomy
+    skills), the rest is filled with other indexed candidates, so small
+    pools are scored exhaustively and the hybrid score still ranks them.
+    """
+    shortlist = dict.fromkeys(candidate_id for candidate_id, _ in skill_index.search(jd_skills, limit))
+    if vector_index is not None and jd_vector is not None:
+        shortlist.update(dict.fromkeys(candidate_id for candidate_id, _ in vector_index.search(jd_vector, limit)))
+    if len(shortlist) < limit:
+        for candidate_id in skill_index.iter_ids():
+            shortlist.setdefault(candidate_id)
+            if len(shortlist) >= limit:
+                break
+    return list(shortlist)
@@ -0,0 +1,279 @@
+# embeddings/candidate_store.py
+import json
+import os
+import threading
+import numpy as np
+
+from preprocessing.resume_parser import extract_resume_text
+from embeddings.skill_extractor import extract_skills
+from embeddings.candidate_index import SkillIndex
+
+class _Snapshot:
+    """Immutable view published to readers: index segments + their liveness masks."""
+
+    def __init__(self, segments, masks):
+        self.segments = segments  # tuple of SkillIndex over candidate ids
+        self.masks = masks        # per segment: bool array, False for tombstoned rows (copy-on-write)
+
+    @property
+    def indexed(self):
+        return sum(len(segment) for segment in self.segments)
+
+class CandidateStore:
+    """
+    Append-only candidate store with incremental add / update / delete.
+
+    Writes go to a pending list (and an optional JSONL log for durability).
+    A background thread publishes them every `refresh_interval` seconds as a
+    new immutable snapshot, so writes become searchable within that delay and
+    readers never take a lock. Updates and deletes tombstone the old version;
+    once there are more than `max_segments` segments, only the small recent
+    ones are merged (tiered, so each entry is re-indexed O(log N) times); a
+    full compaction that drops tombstones and rewrites the log runs only once
+    they exceed `compact_ratio` of the index.
+
+    Can be passed as `skill_index` to embeddings.batch_screener.screen_candidates
+    (with `load_text=store.get_text`).
+    """
+
+    def __init__(self, log_path=None, refresh_interval=1.0, compact_ratio=0.3, max_segments=8):
+        self.log_path = log_path
+        self.refresh_interval = refresh_interval
+        self.compact_ratio = compact_ratio
+        self.max_segments = max_segments
+
+        self._snapshot = _Snapshot((), ())
+        # Live docs: candidate_id -> (version, skills, text). Only the publisher mutates it, one
+        # key at a time, so lock-free single-key reads are safe; search() uses the masks instead.
+        self._docs = {}
+        self._locations = {}  # candidate_id -> (segment number, row) of its live version
+        self._pending = []
+        self._versions = {}
+        self._write_lock = threading.Lock()    # pending list, versions, log file
+        self._publish_lock = threading.Lock()  # serializes refresh/compaction
+        self._stop = threading.Event()
+        self._thread = None
+        self._log = None
+
+        if log_path:
+            if os.path.exists(log_path):
+                self._replay(log_path)
+            self._log = open(log_path, "a", encoding="utf-8")
+
+    # --- Writes ---
+    def add_resume(self, candidate_id, path):
+        """Parses a PDF resume and adds (or updates) the candidate."""
+        return self.add_text(candidate_id, extract_resume_text(path))
+
+    def add_text(self, candidate_id, resume_text, skills=None):
+        """Adds a candidate, or a new version of an existing one. Returns the version."""
+        skills = sorted(extract_skills(resume_text) if skills is None else skills)
+        with self._write_lock:
+            version = self._versions.get(candidate_id, 0) + 1
+            self._versions[candidate_id] = version
+            self._append({"op": "add", "id": candidate_id, "version": version,
+                          "skills": skills, "text": resume_text})
+        return version
+
+    def delete(self, candidate_id):
+        with self._write_lock:
+            if candidate_id in self._versions:
+                self._append({"op": "delete", "id": candidate_id})
+
+    def _append(self, op):
+        self._pending.append(op)
+        if self._log is not None:
+            self._log.write(json.dumps(op) + "\n")
+            self._log.flush()
+
+    def _replay(self, log_path):
+        with open(log_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                op = json.loads(line)
+                if op["op"] == "add":
+                    self._versions[op["id"]] = op["version"]
+                self._pending.append(op)
+        self.refresh()
+
+    # --- Publishing ---
+    def refresh(self):
+        """Publishes pending writes to readers (called periodically in the background)."""
+        with self._publish_lock:
+            with self._write_lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return
+
+            snapshot = self._snapshot
+            masks = list(snapshot.masks)
+            copied = set()
+            segment = SkillIndex()
+            segment_no = len(masks)
+            dead_rows = []  # rows of the new segment superseded within this batch
+            for op in pending:
+                # Tombstone the previous live version, copying only the masks that change
+                old = self._locations.pop(op["id"], None)
+                if old is not None:
+                    old_segment, row = old
+                    if old_segment == segment_no:
+                        dead_rows.append(row)
+                    else:
+                        if old_segment not in copied:
+                            masks[old_segment] = masks[old_segment].copy()
+                            copied.add(old_segment)
+                        masks[old_segment][row] = False
+
+                if op["op"] == "add":
+                    self._locations[op["id"]] = (segment_no, len(segment))
+                    segment.add(op["id"], op["skills"])
+                    self._docs[op["id"]] = (op["version"], op["skills"], op["text"])
+                else:
+                    self._docs.pop(op["id"], None)
+
+            segments = snapshot.segments
+            if len(segment):
+                mask = np.ones(len(segment), dtype=bool)
+                mask[dead_rows] = False
+                segments += (segment,)
+                masks.append(mask)
+            self._snapshot = _Snapshot(segments, tuple(masks))
+
+            dead = self._snapshot.indexed - len(self._docs)
+            if dead > self.compact_ratio * max(self._snapshot.indexed, 1):
+                self._compact_locked()
+            elif len(segments) > self.max_segments:
+                self._merge_tail_locked()
+
+    def compact(self):
+        with self._publish_lock:
+            self._compact_locked()
+
+    def _merge_tail_locked(self):
+        """Merges the newest segments of similar size into one (live rows only)."""
+        snapshot = self._snapshot
+        sizes = [int(mask.sum()) for mask in snapshot.masks]
+        # Grow the tail while the next older segment is no bigger than twice what is merged so far
+        start = len(sizes) - 2
+        while start > 0 and sizes[start - 1] <= 2 * sum(sizes[start:]):
+            start -= 1
+
+        segment = SkillIndex()
+        for old, mask in zip(snapshot.segments[start:], snapshot.masks[start:]):
+            for row in np.flatnonzero(mask):
+                candidate_id = old.candidate_ids[row]
+                self._locations[candidate_id] = (start, len(segment))
+                segment.add(candidate_id, self._docs[candidate_id][1])
+
+        segments, masks = snapshot.segments[:start], snapshot.masks[:start]
+        if len(segment):
+            segments += (segment,)
+            masks += (np.ones(len(segment), dtype=bool),)
+        self._snapshot = _Snapshot(segments, masks)
+
+    def _compact_locked(self):
+        segment = SkillIndex()
+        locations = {}
+        for candidate_id, (_, skills, _) in self._docs.items():
+            locations[candidate_id] = (0, len(segment))
+            segment.add(candidate_id, skills)
+        if len(segment):
+            self._snapshot = _Snapshot((segment,), (np.ones(len(segment), dtype=bool),))
+        else:
+            self._snapshot = _Snapshot((), ())
+        self._locations = locations
+
+        if self._log is not None:
+            self._rewrite_log(self._docs)
+
+    def _rewrite_log(self, docs):
+        # Live docs (the publish lock keeps them fixed) + ops not yet published. Writers keep
+        # appending to the old log meanwhile; only the ops they added are copied under the lock.
+        with self._write_lock:
+            unpublished = list(self._pending)
+            self._log.flush()
+            offset = self._log.tell()
+
+        tmp_path = self.log_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for candidate_id, (version, skills, text) in docs.items():
+                f.write(json.dumps({"op": "add", "id": candidate_id, "version": version,
+                                    "skills": skills, "text": text}) + "\n")
+            for op in unpublished:
+                f.write(json.dumps(op) + "\n")
+
+        with self._write_lock:
+            self._log.close()
+            with open(self.log_path, encoding="utf-8") as old, open(tmp_path, "a", encoding="utf-8") as f:
+                old.seek(offset)
+                f.write(old.read())
+            os.replace(tmp_path, self.log_path)
+            self._log = open(self.log_path, "a", encoding="utf-8")
+
+    def start(self):
+        """Starts the background refresh thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="candidate-store-refresh", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.refresh()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Reads (lock-free: each call works on one published snapshot) ---
+    def __len__(self):
+        return len(self._docs)
+
+    def get_text(self, candidate_id):
+        """Resume text, or None if the candidate was deleted (e.g. after search() returned it)."""
+        doc = self._docs.get(candidate_id)
+        return None if doc is None else doc[2]
+
+    def get_skills(self, candidate_id):
+        return set(self._docs[candidate_id][1])
+
+    def iter_ids(self):
+        """Live candidate ids of the current snapshot."""
+        snapshot = self._snapshot
+        for segment, mask in zip(snapshot.segments, snapshot.masks):
+            for row in np.flatnonzero(mask):
+                yield segment.candidate_ids[row]
+
+    def search(self, jd_skills, limit=2000):
+        """Top `limit` live candidates by matched JD skills: [(candidate_id, match_count), ...]."""
+        snapshot = self._snapshot
+        if not snapshot.segments:
+            return []
+        # Tombstoned rows are zeroed by the liveness masks, then ranked like SkillIndex.search
+        counts = np.concatenate([
+            np.where(mask, segment.match_counts(jd_skills), 0)
+            for segment, mask in zip(snapshot.segments, snapshot.masks)
+        ])
+        hits = np.flatnonzero(counts)
+        if len(hits) > limit:
+            hits = hits[np.argpartition(-counts[hits], limit - 1)[:limit]]
+        hits = hits[np.argsort(-counts[hits], kind="stable")]
+
+        offsets = np.cumsum([0] + [len(segment) for segment in snapshot.segments])
+        segment_nos = np.searchsorted(offsets, hits, side="right") - 1
+        return [(snapshot.segments[s].candidate_ids[i - offsets[s]], int(counts[i]))
+                for s, i in zip(segment_nos, hits)]
@@ -0,0 +1,139 @@
+# embeddings/gap_analytics.py
+import numpy as np
+
+from embeddings.skill_taxonomy import TAXONOMY
+
+SCORE_BINS = 10  # histogram bins over [0, 1]
+
+class GapAggregator:
+    """
+    Incremental skill-gap statistics over a screening run, per role:
+    - missing[role]:    how often each skill was missing (indexed by skill id)
+    - cooccur[role]:    how often two skills were missing together (skill id x skill id)
+    - histogram[role]:  ATS score histogram (SCORE_BINS bins over [0, 1])
+
+    Counters are exact and sized by the taxonomy, not by the number of
+    candidates, so memory stays bounded however large the pool is.
+    Aggregates built in parallel workers are combined with merge().
+    """
+
+    def __init__(self, taxonomy=TAXONOMY, bins=SCORE_BINS):
+        self.taxonomy = taxonomy
+        self.bins = bins
+        self.candidates = {}
+        self.missing = {}
+        self.cooccur = {}
+        self.histogram = {}
+
+    def _role(self, role):
+        if role not in self.candidates:
+            n = len(self.taxonomy.skills)
+            self.candidates[role] = 0
+            self.missing[role] = np.zeros(n, dtype=np.int64)
+            self.cooccur[role] = np.zeros((n, n), dtype=np.int32)
+            self.histogram[role] = np.zeros(self.bins, dtype=np.int64)
+        return role
+
+    def add(self, result):
+        """Counts one screening result (dict with role, missing_skills, ats_score)."""
+        if result.get("error"):
+            return
+        role = self._role(result["role"])
+        self.candidates[role] += 1
+
+        skill_ids = self.taxonomy.skill_ids
+        ids = np.array(sorted({skill_ids[s] for s in result["missing_skills"] if s in skill_ids}), dtype=np.intp)
+        if len(ids):
+            self.missing[role][ids] += 1
+            # Only the upper triangle (i < j) is filled; ids are unique, so fancy indexing is safe
+            self.cooccur[role][np.ix_(ids, ids)] += np.triu(np.ones((len(ids), len(ids)), dtype=np.int32), 1)
+
+        score = min(max(float(result["ats_score"]), 0.0), 1.0)
+        self.histogram[role][min(int(score * self.bins), self.bins - 1)] += 1
+
+    def update(self, results):
+        for result in results:
+            self.add(result)
+        return self
+
+    def merge(self, other):
+        """Adds another aggregate's counts into this one (e.g. from a pool worker)."""
+        if other.bins != self.bins or other.taxonomy.skills != self.taxonomy.skills:
+            raise ValueError("Cannot merge aggregates built with a different taxonomy or binning")
+        for role in other.candidates:
+            self._role(role)
+            self.candidates[role] += other.candidates[role]
+            self.missing[role] += other.missing[role]
+            self.cooccur[role] += other.cooccur[role]
+            self.histogram[role] += other.histogram[role]
+        return self
+
+    def _select(self, counters, role):
+        if role is not None:
+            return counters.get(role)
+        return sum(counters.values()) if counters else None
+
+    def top_missing(self, role=None, n=10):
+        """[(skill, count, share of candidates)] most often missing (all roles if role is None)."""
+        counts = self._select(self.missing, role)
+        total = self.candidates.get(role, 0) if role is not None else sum(self.candidates.values())
+        if counts is None or not total:
+            return []
+        top = np.argsort(-counts, kind="stable")[:n]
+        return [(self.taxonomy.skills[i], int(counts[i]), counts[i] / total) for i in top if counts[i]]
+
+    def top_gap_pairs(self, role=None, n=10):
+        """[((skill_a, skill_b), count)] pairs of skills most often missing together."""
+        pairs = self._select(self.cooccur, role)
+        if pairs is None:
+            return []
+        flat = pairs.ravel()
+        top = np.argsort(-flat, kind="stable")[:n]
+        size = pairs.shape[1]
+        return [((self.taxonomy.skills[i // size], self.taxonomy.skills[i % size]), int(flat[i]))
+                for i in top if flat[i]]
+
+    def score_histogram(self, role=None):
+        """[(bin_low, bin_high, count)] of ATS scores."""
+        counts = self._select(self.histogram, role)
+        if counts is None:
+            counts = np.zeros(self.bins, dtype=np.int64)
+        edges = np.linspace(0.0, 1.0, self.bins + 1)
+        return [(float(edges[i]), float(edges[i + 1]), int(counts[i])) for i in range(self.bins)]
+
+    def summary(self, n=10):
+        """JSON-friendly report per role."""
+        return {
+            role: {
+                "candidates": self.candidates[role],
+                "top_missing": [{"skill": s, "count": c, "share": round(float(share), 4)}
+                                for s, c, share in self.top_missing(role, n)],
+                "top_gap_pairs": [{"skills": list(pair), "count": c} for pair, c in self.top_gap_pairs(role, n)],
+                "score_histogram": [c for _, _, c in self.score_histogram(role)],
+            }
+            for role in self.candidates
+        }
+
+def _aggregate_batch(results):
+    """Pool worker: partial aggregate for one batch of results."""
+    return GapAggregator().update(results)
+
+def aggregate_gaps(result_batches, workers=None):
+    """
+    Builds a GapAggregator over batches of screening results. With workers,
+    batches are aggregated in a process pool and the partial aggregates merged.
+    """
+    aggregator = GapAggregator()
+    if not workers:
+        for batch in result_batches:
+            aggregator.update(batch)
+        return aggregator
+
+    # Imported here: only needed for the parallel path
+    from preprocessing.resume_parser import run_in_pool
+
+    for _, partial, error in run_in_pool(_aggregate_batch, result_batches, workers):
+        if error is not None:
+            raise RuntimeError(f"Gap aggregation worker failed: {error}")
+        aggregator.merge(partial)
+    return aggregator
@@ -0,0 +1,107 @@
+# embeddings/matrix_scorer.py
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from embeddings.skill_taxonomy import TAXONOMY
+from embeddings.skill_extractor import extract_skills
+from embeddings.batch_screener import prepare_jd
+from embeddings.similarity_engine import apply_score_curve
+from monitoring.metrics import timed
+
+def skill_matrix(skill_sets, taxonomy=TAXONOMY):
+    """Binary CSR matrix (documents x taxonomy skills) from a list of skill sets."""
+    indptr, indices = [0], []
+    for skills in skill_sets:
+        indices.extend(sorted(taxonomy.skill_ids[s] for s in skills if s in taxonomy.skill_ids))
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.float32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(skill_sets), len(taxonomy.skills)))
+
+def _top_k_rows(scores, k):
+    """Column indices of the k best scores in each row, best first."""
+    k = min(k, scores.shape[1])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1)
+
+class MatrixScorer:
+    """
+    Scores every resume against every open JD with sparse matrix products.
+
+    Keyword match ratios come from (resume x skill) @ (skill x JD); semantic
+    cosine from hashed, l2-normalized text vectors (as in ATSScorer). Resumes
+    are processed in blocks, so only a block x n_jds score array is dense at
+    a time; the top-k JDs per resume and resumes per JD are kept as it goes.
+    """
+
+    def __init__(self, jd_texts, n_features=2 ** 20):
+        # jd_texts: {jd_id: text} or a list (index is the jd_id)
+        items = list(jd_texts.items() if isinstance(jd_texts, dict) else enumerate(jd_texts))
+        self.jd_ids = [jd_id for jd_id, _ in items]
+        self.jd_states = [prepare_jd(text) for _, text in items]
+        self.vectorizer = HashingVectorizer(
+            stop_words='english', alternate_sign=False, norm='l2', n_features=n_features
+        )
+
+        # (skills x JDs) for keyword matches, and required-skill count per JD
+        self.jd_skills = skill_matrix([state["skills"] for state in self.jd_states]).T.tocsc()
+        self.jd_skill_counts = np.asarray(self.jd_skills.sum(axis=0)).ravel()
+        if self.jd_states:
+            self.jd_vectors = self.vectorizer.transform([state["text"] for state in self.jd_states]).T.tocsc()
+        else:
+            # HashingVectorizer cannot transform an empty list
+            self.jd_vectors = sparse.csc_matrix((n_features, 0), dtype=np.float64)
+
+    def score_block(self, resume_texts):
+        """Dense (len(resume_texts) x n_jds) ATS scores for one block of resumes."""
+        resume_skills = skill_matrix([extract_skills(text) for text in resume_texts])
+        matches = (resume_skills @ self.jd_skills).toarray()
+        kw = np.divide(matches, self.jd_skill_counts,
+                       out=np.zeros_like(matches), where=self.jd_skill_counts > 0)
+        semantic = (self.vectorizer.transform(resume_texts) @ self.jd_vectors).toarray()
+        return apply_score_curve(kw, semantic)
+
+    @timed("matrix_rank")
+    def rank(self, resumes, top_k=10, block_size=1024):
+        """
+        Ranks all resumes against all JDs.
+
+        `resumes` is a dict {candidate_id: text} or a list (index is the id).
+        Returns (top_jds, top_resumes):
+          top_jds[candidate_id] = [(jd_id, score), ...]  best first
+          top_resumes[jd_id]    = [(candidate_id, score), ...]  best first
+        """
+        items = iter(resumes.items() if isinstance(resumes, dict) else enumerate(resumes))
+        n_jds = len(self.jd_ids)
+        candidate_ids = []
+        top_jds = {}
+        # Running top-k per JD: positions in candidate_ids and scores (k x n_jds)
+        best_rows = np.empty((0, n_jds), dtype=np.int64)
+        best_scores = np.empty((0, n_jds))
+
+        while n_jds:
+            block = [item for _, item in zip(range(block_size), items)]
+            if not block:
+                break
+            offset = len(candidate_ids)
+            candidate_ids.extend(candidate_id for candidate_id, _ in block)
+            scores = self.score_block([text for _, text in block])
+
+            top_cols = _top_k_rows(scores, top_k)
+            for row, cols in enumerate(top_cols):
+                top_jds[candidate_ids[offset + row]] = [(self.jd_ids[c], float(scores[row, c])) for c in cols]
+
+            # Merge this block into the per-JD top-k
+            block_rows = np.broadcast_to(np.arange(offset, offset + len(block))[:, None], scores.shape)
+            merged_scores = np.vstack([best_scores, scores])
+            merged_rows = np.vstack([best_rows, block_rows])
+            keep = _top_k_rows(merged_scores.T, top_k).T
+            best_scores = np.take_along_axis(merged_scores, keep, axis=0)
+            best_rows = np.take_along_axis(merged_rows, keep, axis=0)
+
+        top_resumes = {
+            jd_id: [(candidate_ids[best_rows[r, j]], float(best_scores[r, j])) for r in range(best_scores.shape[0])]
+            for j, jd_id in enumerate(self.jd_ids)
+        }
+        return top_jds, top_resumes
@@ -0,0 +1,157 @@
+# embeddings/results_store.py
+import json
+
+import numpy as np
+import pandas as pd
+
+from embeddings.skill_taxonomy import TAXONOMY
+
+SKILL_KINDS = ("resume", "required", "missing")
+# Parquet schema metadata key holding the taxonomy skill list the bit positions refer to
+SKILLS_METADATA_KEY = b"careervantage.skills"
+_WORD_MASK = (1 << 64) - 1
+
+def _popcount(words):
+    """Per-element popcount of a uint64 array."""
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        return np.bitwise_count(words).astype(np.int64)
+    as_bytes = words.reshape(-1, 1).view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1).sum(axis=1).reshape(words.shape).astype(np.int64)
+
+class ResultsStore:
+    """
+    Columnar store of screening outcomes (one row per candidate per JD).
+
+    Skill lists are stored as fixed-width bitsets over taxonomy skill ids,
+    split into uint64 columns (<kind>_bits_0, <kind>_bits_1, ...), so skill
+    filters run as vectorized bit operations over millions of rows.
+    Persists as Parquet (pandas + pyarrow), with the taxonomy's skill list
+    in the file metadata so bitsets are never decoded against another one.
+    """
+
+    def __init__(self, frame=None, taxonomy=TAXONOMY):
+        self.taxonomy = taxonomy
+        self.n_words = (len(taxonomy.skills) + 63) // 64
+        self._frame = frame if frame is not None else pd.DataFrame(columns=self._columns())
+        self._batches = []  # appended since the last concat (see frame)
+
+    @property
+    def frame(self):
+        # Appends are buffered and concatenated once on read, not on every append()
+        if self._batches:
+            frames = ([self._frame] if len(self._frame) else []) + self._batches
+            self._frame = pd.concat(frames, ignore_index=True)
+            self._batches = []
+        return self._frame
+
+    def _columns(self):
+        bits = [f"{kind}_bits_{i}" for kind in SKILL_KINDS for i in range(self.n_words)]
+        return ["run_id", "jd_id", "candidate_id", "ats_score", "keyword_score", "role"] + bits
+
+    def _split_bits(self, bits):
+        return [(bits >> (64 * i)) & _WORD_MASK for i in range(self.n_words)]
+
+    def append(self, results, jd_id, run_id=None):
+        """Adds screening results (dicts as returned by screen_batch / the CLI) for one JD."""
+        columns = {name: [] for name in self._columns()}
+        for result in results:
+            if result.get("error"):
+                continue
+            columns["run_id"].append(run_id)
+            columns["jd_id"].append(jd_id)
+            columns["candidate_id"].append(result["candidate_id"])
+            columns["ats_score"].append(result["ats_score"])
+            columns["keyword_score"].append(result["keyword_score"])
+            columns["role"].append(result["role"])
+            for kind in SKILL_KINDS:
+                words = self._split_bits(self.taxonomy.to_bits(result[f"{kind}_skills"]))
+                for i, word in enumerate(words):
+                    columns[f"{kind}_bits_{i}"].append(word)
+
+        batch = pd.DataFrame(columns)
+        batch["ats_score"] = batch["ats_score"].astype(np.float32)
+        batch["keyword_score"] = batch["keyword_score"].astype(np.float32)
+        for name in self._columns():
+            if "_bits_" in name:
+                batch[name] = batch[name].astype(np.uint64)
+        if len(batch):
+            self._batches.append(batch)
+        return len(batch)
+
+    def save(self, path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        frame = self.frame.copy()
+        frame["role"] = frame["role"].astype("category")
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[SKILLS_METADATA_KEY] = json.dumps(self.taxonomy.skills).encode("utf-8")
+        pq.write_table(table.replace_schema_metadata(metadata), path)
+
+    @classmethod
+    def load(cls, path, taxonomy=TAXONOMY):
+        """Loads a saved store; raises ValueError if it was written with a different taxonomy."""
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        stored = (table.schema.metadata or {}).get(SKILLS_METADATA_KEY)
+        if stored is None or tuple(json.loads(stored)) != taxonomy.skills:
+            raise ValueError(f"{path} was written with a different skill taxonomy; its skill bitsets cannot be decoded")
+        frame = table.to_pandas()
+        frame["role"] = frame["role"].astype(str)
+        return cls(frame, taxonomy)
+
+    def _bits(self, kind):
+        return [self.frame[f"{kind}_bits_{i}"].to_numpy(dtype=np.uint64) for i in range(self.n_words)]
+
+    def query(self, jd_id=None, min_score=None, role=None, skills=None, max_missing=None, run_id=None):
+        """
+        Vectorized filter, e.g. "all candidates for JD X with score >= 0.6
+        missing at most 2 of these skills":
+            store.query(jd_id="X", min_score=0.6, skills=[...], max_missing=2)
+        `max_missing` counts how many of `skills` are absent from the resume;
+        skills outside the taxonomy are never recorded, so they count as missing.
+        Returns the matching rows (best score first).
+        """
+        mask = np.ones(len(self.frame), dtype=bool)
+        if jd_id is not None:
+            mask &= (self.frame["jd_id"] == jd_id).to_numpy()
+        if run_id is not None:
+            mask &= (self.frame["run_id"] == run_id).to_numpy()
+        if role is not None:
+            mask &= (self.frame["role"] == role).to_numpy()
+        if min_score is not None:
+            mask &= self.frame["ats_score"].to_numpy() >= min_score
+        if skills is not None and max_missing is not None:
+            skills = set(skills)
+            wanted = [np.uint64(word) for word in self._split_bits(self.taxonomy.to_bits(skills))]
+            unknown = len(skills - self.taxonomy.skill_ids.keys())
+            missing = np.full(len(self.frame), unknown, dtype=np.int64)
+            for word, resume_word in zip(wanted, self._bits("resume")):
+                missing += _popcount(word & ~resume_word)
+            mask &= missing <= max_missing
+
+        return self.frame[mask].sort_values("ats_score", ascending=False)
+
+    def skills_of(self, row, kind="missing"):
+        """Decodes a row's skill bitset back to a set of skill names."""
+        bits = 0
+        for i in range(self.n_words):
+            bits |= int(row[f"{kind}_bits_{i}"]) << (64 * i)
+        return self.taxonomy.from_bits(bits)
+
+    def missing_skill_counts(self, jd_id=None):
+        """How often each skill is missing (vectorized over all rows, or one JD)."""
+        frame = self.frame if jd_id is None else self.frame[self.frame["jd_id"] == jd_id]
+        counts = {}
+        for i in range(self.n_words):
+            words = frame[f"missing_bits_{i}"].to_numpy(dtype=np.uint64)
+            for bit in range(64):
+                skill_id = 64 * i + bit
+                if skill_id >= len(self.taxonomy.skills):
+                    break
+                n = int(np.count_nonzero(words & np.uint64(1 << bit)))
+                if n:
+                    counts[self.taxonomy.skills[skill_id]] = n
+        return counts
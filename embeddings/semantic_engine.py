@@ -0,0 +1,90 @@
+# embeddings/semantic_engine.py
+import hashlib
+import os
+import threading
+import numpy as np
+
+from embeddings.similarity_engine import apply_score_curve
+from embeddings.vector_store import VectorStore
+from monitoring.metrics import timed
+
+# Small CPU-friendly model; override with CAREERVANTAGE_EMBEDDING_MODEL
+EMBEDDING_MODEL = os.environ.get("CAREERVANTAGE_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+DEFAULT_STORE_PATH = os.environ.get(
+    "CAREERVANTAGE_VECTOR_STORE",
+    os.path.join(os.path.expanduser("~"), ".cache", "careervantage", "vectors"),
+)
+
+def document_key(text):
+    """Content hash used as the vector store key."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class SemanticScorer:
+    """
+    Embedding-based alternative to the CountVectorizer cosine in calculate_ats_score.
+
+    Resumes are embedded once (batched) and kept in a memory-mapped VectorStore
+    keyed by their text hash, so re-screening against new JDs costs only the JD
+    encode plus a matrix-vector product. The model is loaded on first use.
+    """
+
+    def __init__(self, store_path=None, model_name=None, batch_size=64):
+        self.store_path = store_path or DEFAULT_STORE_PATH
+        self.model_name = model_name or EMBEDDING_MODEL
+        self.batch_size = batch_size
+        self._model = None
+        self._store = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.model_name, device="cpu")
+        return self._model
+
+    @property
+    def store(self):
+        if self._store is None:
+            dim = self.model.get_sentence_embedding_dimension()
+            with self._lock:
+                if self._store is None:
+                    self._store = VectorStore(self.store_path, dim)
+        return self._store
+
+    def encode(self, texts):
+        return self.model.encode(
+            list(texts), batch_size=self.batch_size, normalize_embeddings=True, show_progress_bar=False
+        )
+
+    def embed_documents(self, texts):
+        """
+        Returns (keys, vectors) for `texts`, encoding only those not already
+        in the store. New vectors are persisted before returning.
+        """
+        keys = [document_key(text) for text in texts]
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in self.store and key not in missing:
+                missing[key] = text
+        if missing:
+            self.store.add(list(missing), self.encode(missing.values()))
+            self.store.flush()
+        return keys, self.store.get(keys)
+
+    def semantic_scores(self, resume_texts, jd_text):
+        """Cosine similarity (floored at 0) of each resume to the JD, as a NumPy array."""
+        _, resume_vectors = self.embed_documents(resume_texts)
+        jd_vector = self.encode([jd_text])[0]
+        return np.clip(resume_vectors @ jd_vector, 0.0, 1.0)
+
+    @timed("semantic_score_batch")
+    def score_batch(self, resume_texts, jd_text, kw_match_scores):
+        """Same hybrid 0.7/0.3 boosted score as ATSScorer, with embedding similarity."""
+        return apply_score_curve(kw_match_scores, self.semantic_scores(resume_texts, jd_text))
+
+    def top_candidates(self, jd_text, k=10):
+        """Nearest stored resumes to a JD: [(document_key, similarity), ...]."""
+        return self.store.search(self.encode([jd_text])[0], k)
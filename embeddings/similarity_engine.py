@@ -1,8 +1,18 @@
 import re
 from collections import Counter
-from sklearn.feature_extraction.text import CountVectorizer
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from monitoring.metrics import timed
 
+# Hybrid weights and the "Reality Curve" (see calculate_ats_score)
+KEYWORD_WEIGHT = 0.7
+SEMANTIC_WEIGHT = 0.3
+BOOST_MULTIPLIER = 2.5
+SCORE_FLOOR = 0.10
+SCORE_CAP = 0.98
+
+@timed("calculate_ats_score")
 def calculate_ats_score(resume_text, jd_text, kw_match_score):
     """
     Calculates a weighted ATS score using a hybrid of:
@@ -24,7 +34,7 @@ def calculate_ats_score(resume_text, jd_text, kw_match_score):
     # --- 2. Weighted Hybrid Calculation ---
     # Keywords are King in ATS, so we give them 70% weight.
     # Semantic context gets 30%.
-    raw_score = (kw_match_score * 0.7) + (semantic_score * 0.3)
+    raw_score = (kw_match_score * KEYWORD_WEIGHT) + (semantic_score * SEMANTIC_WEIGHT)
 
     # --- 3. The "Reality Curve" (Boosting) ---
     # Most JDs list 50+ skills. Matching 25% of them is actually a GOOD score.
@@ -33,9 +43,43 @@ def calculate_ats_score(resume_text, jd_text, kw_match_score):
     #   Raw Match 20% -> Boosted to 40% (Moderate)
     #   Raw Match 30% -> Boosted to 60% (Strong)
     
-    boosted_score = raw_score * 2.5 # Multiplier to lift the range
+    boosted_score = raw_score * BOOST_MULTIPLIER # Multiplier to lift the range
     
     # Apply Limits (Cap at 98%, Floor at 10%)
-    final_score = min(0.98, max(0.10, boosted_score))
+    final_score = min(SCORE_CAP, max(SCORE_FLOOR, boosted_score))
+
+    return final_score
+
+def apply_score_curve(kw_match_scores, semantic_scores):
+    """Vectorized hybrid weighting + boosting curve of calculate_ats_score (NumPy arrays in/out)."""
+    kw = np.asarray(kw_match_scores, dtype=float)
+    semantic = np.asarray(semantic_scores, dtype=float)
+    raw = (kw * KEYWORD_WEIGHT) + (semantic * SEMANTIC_WEIGHT)
+    return np.clip(raw * BOOST_MULTIPLIER, SCORE_FLOOR, SCORE_CAP)
+
+class ATSScorer:
+    """
+    Scores many resumes against one JD in a single sparse matrix-vector product.
+
+    Uses a HashingVectorizer instead of fitting a CountVectorizer per pair:
+    it has the same tokenizer and stop words but needs no vocabulary, so
+    nothing is re-fitted per call and the JD vector is built only once.
+    Cosine scores match calculate_ats_score up to (rare) hash collisions.
+    """
+
+    def __init__(self, jd_text, n_features=2 ** 20):
+        self.vectorizer = HashingVectorizer(
+            stop_words='english', alternate_sign=False, norm='l2', n_features=n_features
+        )
+        # Column vector (n_features x 1), l2-normalized => dot product == cosine
+        self.jd_vector = self.vectorizer.transform([jd_text]).T.tocsc()
+
+    def semantic_scores(self, resume_texts):
+        """Cosine similarity of each resume to the JD, as a 1-D NumPy array."""
+        resume_matrix = self.vectorizer.transform(resume_texts)
+        return (resume_matrix @ self.jd_vector).toarray().ravel()
 
-    return final_score
\ No newline at end of file
+    @timed("ats_score_batch")
+    def score_batch(self, resume_texts, kw_match_scores):
+        """Vectorized calculate_ats_score for a whole batch of resumes."""
+        return apply_score_curve(kw_match_scores, self.semantic_scores(resume_texts))
@@ -1,148 +1,175 @@
 # embeddings/skill_extractor.py
 import re
+from monitoring.metrics import timed
 
-# --- 1. Expanded Skill Database (Tech + Non-Tech Roles) ---
-SKILL_CATEGORIES = {
-    # === TECHNOLOGY ROLES ===
-    "Data Analyst": {
-        "sql", "excel", "tableau", "power bi", "python", "r", "pandas", "numpy", 
-        "data visualization", "statistics", "cleaning", "etl", "snowflake"
-    },
-    "Software Developer": {
-        "python", "java", "c++", "c#", "javascript", "typescript", "react", "node.js", 
-        "git", "docker", "agile", "sql", "dsa", "oop", "algorithms"
-    },
-    "Machine Learning Engineer": {
-        "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn", 
-        "nlp", "computer vision", "transformers", "mlops", "aws sagemaker", "model deployment"
-    },
-    "DevOps Engineer": {
-        "aws", "azure", "linux", "jenkins", "kubernetes", "docker", "terraform", 
-        "ansible", "ci/cd", "bash", "scripting", "monitoring", "prometheus", "grafana"
-    },
-    "Cybersecurity Analyst": {
-        "network security", "firewalls", "wireshark", "penetration testing", "siem", 
-        "linux", "cryptography", "risk assessment", "incident response", "compliance", "kalilinux"
-    },
-    "Full Stack Developer": {
-        "html", "css", "javascript", "react", "angular", "node.js", "django", "flask", 
-        "mongodb", "sql", "rest api", "graphql", "aws", "git"
-    },
-    "Cloud Architect": {
-        "aws", "azure", "gcp", "cloud formation", "iam", "vpc", "ec2", "s3", 
-        "lambda", "microservices", "serverless", "distributed systems", "security"
-    },
-    "Network Engineer": {
-        "tcp/ip", "dns", "dhcp", "vpn", "routing", "switching", "cisco", "juniper", 
-        "firewalls", "lan", "wan", "subnetting", "wireshark"
-    },
-    "QA Automation Engineer": {
-        "selenium", "junit", "testng", "pytest", "cypress", "appium", "java", "python", 
-        "jenkins", "api testing", "postman", "jira", "agile"
-    },
-    "Product Manager": {
-        "product roadmap", "agile", "scrum", "user stories", "market research", "jira", 
-        "confluence", "stakeholder management", "analytics", "a/b testing", "ux"
-    },
-    "UI/UX Designer": {
-        "figma", "adobe xd", "sketch", "wireframing", "prototyping", "user research", 
-        "usability testing", "html", "css", "responsive design", "accessibility"
-    },
-
-    # === ACADEMIC & EDUCATION ROLES ===
-    "School Teacher": {
-        "classroom management", "lesson planning", "curriculum development", "student assessment",
-        "special education", "differentiated instruction", "child psychology", "edtech", 
-        "google classroom", "parent communication", "k-12", "literacy", "numeracy"
-    },
-    "PUC Lecturer": {
-        "subject expertise", "lecturing", "student counseling", "examination duties", 
-        "academic administration", "physics", "chemistry", "mathematics", "biology", 
-        "college admissions", "competitive exam coaching", "lab supervision"
-    },
-    "Engineering Lecturer": {
-        "teaching", "curriculum design", "research", "mentoring", "communication", 
-        "matlab", "simulink", "autocad", "academic writing", "presentation", "pedagogy"
-    },
-
-    # === MEDICAL & SCIENCE ROLES ===
-    "Doctor": {
-        "patient care", "diagnosis", "surgery", "treatment planning", "medical records", 
-        "emr", "clinical research", "public health", "emergency medicine", "pediatrics", 
-        "internal medicine", "medical ethics", "hipaa", "cardiology", "anatomy"
-    },
-    "Scientist": {
-        "hypothesis testing", "laboratory safety", "microscopy", "spectroscopy", 
-        "chromatography", "pcr", "molecular biology", "chemistry", "physics", 
-        "experimental design", "data analysis", "scientific writing", "peer review"
-    },
-    "Researcher": {
-        "literature review", "data collection", "statistical analysis", "spss", "qualitative research", 
-        "quantitative research", "grant writing", "publication", "surveys", "interviewing", 
-        "critical thinking", "ethics"
-    }
-}
+# --- 1. Skill Database (shared taxonomy, see embeddings/skill_taxonomy.json) ---
+from embeddings.skill_taxonomy import TAXONOMY, SKILL_CATEGORIES
 
 # Combine all unique skills into one set for general scanning
-ALL_SKILLS = set().union(*SKILL_CATEGORIES.values())
+ALL_SKILLS = set(TAXONOMY.skills)
+
+# --- 2. Context Boosting (job-title words that hint at a role) ---
+# Checked in order; only the first matching group applies (same as an if/elif chain).
+CONTEXT_BOOSTS = [
+    ({"school", "schools", "k-12", "grade", "grades"}, {"School Teacher": 5}),
+    ({"college", "colleges", "university", "universities", "professor", "professors"},
+     {"Engineering Lecturer": 3, "PUC Lecturer": 3}),
+    ({"hospital", "hospitals", "clinic", "clinics", "clinical", "patient", "patients"}, {"Doctor": 5}),
+    ({"lab", "labs", "laboratory", "experiment", "experiments", "experimental"}, {"Scientist": 3}),
+]
+CONTEXT_TERMS = set().union(*(keywords for keywords, _ in CONTEXT_BOOSTS))
+
+_ALL_TERMS = ALL_SKILLS | CONTEXT_TERMS
+
+def _build_trie_pattern(words):
+    """Folds a word list into one regex trie so shared prefixes are matched once."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def _emit(node):
+        branches = [re.escape(ch) + _emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional => the longest term is tried first, shorter ones on backtrack
+        return "(?:" + body + ")?" if "" in node else body
+
+    return _emit(trie)
+
+# Compiled once at import: a single pass finds every skill/context term starting at each word boundary.
+# The lookahead keeps matches zero-width so overlapping skills ("network security" / "security") are all seen.
+_TERM_PATTERN = re.compile(r"\b(?=(" + _build_trie_pattern(_ALL_TERMS) + r")\b)")
+
+# Terms that are a prefix of another term ("aws" / "aws sagemaker") can match at the same
+# position as the longer one, so they are re-checked explicitly after a longer hit.
+_PREFIX_TERMS = {
+    term: [(other, re.compile(re.escape(other) + r"\b")) for other in _ALL_TERMS
+           if other != term and term.startswith(other)]
+    for term in _ALL_TERMS
+}
+
+_MAX_TERM_LENGTH = max(len(term) for term in _ALL_TERMS)
+
+def _scan_terms(text, final=True, start=0):
+    """
+    One pass over lowercased text; returns every skill and context term found.
+    With final=False the text is a partial chunk: terms touching its end are
+    skipped, since the word may continue in the next chunk. Terms are only
+    matched from `start` on; text before it is left context for \b.
+    """
+    found = set()
+
+    # \b ensures exact word matching (e.g., avoids matching "java" in "javascript")
+    for match in _TERM_PATTERN.finditer(text, start):
+        term = match.group(1)
+        if not final and match.start() + len(term) == len(text):
+            continue
+        found.add(term)
+        for prefix, pattern in _PREFIX_TERMS[term]:
+            if prefix not in found and pattern.match(text, match.start()):
+                found.add(prefix)
+
+    return found
 
+@timed("extract_skills")
 def extract_skills(text):
-    """Extracts all known skills from text using regex for accuracy."""
-    text = text.lower()
-    found_skills = set()
-    
-    # We check against the massive combined list of ALL skills
-    for skill in ALL_SKILLS:
-        # \b ensures exact word matching (e.g., avoids matching "java" in "javascript")
-        if re.search(r"\b" + re.escape(skill) + r"\b", text):
-            found_skills.add(skill)
-            
-    return found_skills
+    """Extracts all known skills from text in a single regex pass."""
+    return _scan_terms(text.lower()) & ALL_SKILLS
 
-def detect_job_role(jd_text):
+def extract_skills_streaming(pages, overlap=64):
     """
-    Auto-detects the job role by counting keywords and applying logic tweaks.
+    Incremental extract_skills over text that arrives in pieces (e.g. PDF pages).
+    Yields (page_text, skills_so_far) after each page; a page is reported once
+    the next one has arrived (or the input ends), since a word at a page break
+    may continue on the next page. The tail of each chunk is rescanned with
+    the following page, so skills spanning a page break are still found.
     """
-    jd_text = jd_text.lower()
-    role_scores = {}
-    
-    # 1. Base Score: Count how many skills from each category appear in the JD
-    for role, skills in SKILL_CATEGORIES.items():
-        count = sum(1 for skill in skills if skill in jd_text)
-        role_scores[role] = count
-    
+    overlap = max(overlap, 2 * _MAX_TERM_LENGTH)
+    found = set()
+    tail, start = "", 0
+    pages = iter(pages)
+    page_text = next(pages, None)
+    while page_text is not None:
+        next_page = next(pages, None)
+        chunk = tail + page_text.lower()
+        found |= _scan_terms(chunk, final=next_page is None, start=start) & ALL_SKILLS
+
+        # Carry the last `overlap` chars (covers any term touching the end) plus one char
+        # before them, so a tail starting mid-word does not get a false \b at its start.
+        # Terms starting at that first char are too far from the end to have been skipped.
+        if len(chunk) > overlap:
+            tail, start = chunk[-(overlap + 1):], 1
+        else:
+            tail, start = chunk, 0
+        yield page_text, set(found)
+        page_text = next_page
+
+def _score_roles(terms):
+    # 1. Base Score: how many of each role's skills were found (bitset intersections)
+    jd_bits = TAXONOMY.to_bits(terms)
+    role_scores = {role: TAXONOMY.count(role_bits & jd_bits) for role, role_bits in TAXONOMY.role_bits.items()}
+
     # 2. Context Boosting: Boost score if specific job titles appear in text
-    if "school" in jd_text or "k-12" in jd_text or "grade" in jd_text:
-        role_scores["School Teacher"] += 5
-    elif "college" in jd_text or "university" in jd_text or "professor" in jd_text:
-        role_scores["Engineering Lecturer"] += 3
-        role_scores["PUC Lecturer"] += 3
-    elif "hospital" in jd_text or "clinic" in jd_text or "patient" in jd_text:
-        role_scores["Doctor"] += 5
-    elif "lab" in jd_text or "experiment" in jd_text:
-        role_scores["Scientist"] += 3
-    
+    for keywords, boosts in CONTEXT_BOOSTS:
+        if not terms.isdisjoint(keywords):
+            for role, boost in boosts.items():
+                if role in role_scores:
+                    role_scores[role] += boost
+            break
+
+    return role_scores
+
+def _pick_role(role_scores):
     # Return the role with the highest keyword match
     if not role_scores or max(role_scores.values()) == 0:
         return "Software Developer" # Default fallback
-        
+
     return max(role_scores, key=role_scores.get)
 
-def identify_missing_skills(resume_text, jd_text):
-    # 1. Detect Role based on JD content
-    role = detect_job_role(jd_text)
-    
-    # 2. Extract Skills
-    resume_skills = extract_skills(resume_text)
-    jd_skills = extract_skills(jd_text)
-    
-    # 3. Find Missing Skills (only those present in JD but not in Resume)
+def score_job_roles(jd_text):
+    """Returns {role: score} for a JD (skill matches per role plus context boosts)."""
+    return _score_roles(_scan_terms(jd_text.lower()))
+
+@timed("detect_job_role")
+def detect_job_role(jd_text):
+    """
+    Auto-detects the job role by counting keywords and applying logic tweaks.
+    Uses the same word-boundary matching as extract_skills.
+    """
+    return _pick_role(score_job_roles(jd_text))
+
+@timed("analyze_jd")
+def analyze_jd(jd_text):
+    """Returns (jd_skills, role) from a single pass over the JD text."""
+    terms = _scan_terms(jd_text.lower())
+    return terms & ALL_SKILLS, _pick_role(_score_roles(terms))
+
+def compare_skills(resume_skills, jd_skills):
+    """Returns (missing_skills, keyword_score) for already-extracted skill sets."""
+    # Find Missing Skills (only those present in JD but not in Resume)
     missing_skills = list(jd_skills - resume_skills)
-    
-    # 4. Calculate Weighted Score
+
+    # Calculate Weighted Score
     match_count = len(jd_skills.intersection(resume_skills))
     total_jd = len(jd_skills)
-    
+
     keyword_score = match_count / total_jd if total_jd > 0 else 0
+
+    return missing_skills, keyword_score
+
+@timed("identify_missing_skills")
+def identify_missing_skills(resume_text, jd_text):
+    # 1. Detect Role & Extract JD Skills (one pass over the JD)
+    jd_skills, role = analyze_jd(jd_text)
+    
+    # 2. Extract Resume Skills
+    resume_skills = extract_skills(resume_text)
+    
+    # 3. Compare (missing skills + keyword score)
+    missing_skills, keyword_score = compare_skills(resume_skills, jd_skills)
     
     return list(resume_skills), list(jd_skills), missing_skills, keyword_score, role
\ No newline at end of file
@@ -0,0 +1,56 @@
+# embeddings/skill_taxonomy.py
+import json
+import os
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_taxonomy.json")
+
+class SkillTaxonomy:
+    """
+    Role -> skills taxonomy with compact indexes built once at load time:
+    - skill_ids:   skill -> integer id (ids follow sorted skill order)
+    - role_bits:   role -> int bitset of its skill ids
+    - skill_roles: skill -> tuple of roles that list it (inverted index)
+    """
+
+    def __init__(self, categories):
+        # Role order is kept as given: it breaks ties in role detection
+        self.categories = {role: set(skills) for role, skills in categories.items()}
+        self.roles = tuple(self.categories)
+        self.skills = tuple(sorted(set().union(*self.categories.values())))
+        self.skill_ids = {skill: i for i, skill in enumerate(self.skills)}
+        self.role_bits = {role: self.to_bits(skills) for role, skills in self.categories.items()}
+        self.skill_roles = {
+            skill: tuple(role for role in self.roles if skill in self.categories[role])
+            for skill in self.skills
+        }
+
+    def to_bits(self, skills):
+        """Bitset of the known skills in `skills` (unknown ones are ignored)."""
+        bits = 0
+        for skill in skills:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is not None:
+                bits |= 1 << skill_id
+        return bits
+
+    def from_bits(self, bits):
+        """Set of skill names in a bitset."""
+        skills = set()
+        while bits:
+            low = bits & -bits
+            skills.add(self.skills[low.bit_length() - 1])
+            bits ^= low
+        return skills
+
+    @staticmethod
+    def count(bits):
+        return bin(bits).count("1")
+
+def load_taxonomy(path=None):
+    """Loads a taxonomy from a JSON file of {role: [skills]} (the bundled one by default)."""
+    with open(path or DEFAULT_TAXONOMY_PATH, encoding="utf-8") as f:
+        return SkillTaxonomy(json.load(f))
+
+# Shared instance; CAREERVANTAGE_TAXONOMY points to a custom data file
+TAXONOMY = load_taxonomy(os.environ.get("CAREERVANTAGE_TAXONOMY"))
+SKILL_CATEGORIES = TAXONOMY.categories
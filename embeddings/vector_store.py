@@ -0,0 +1,126 @@
+# embeddings/vector_store.py
+import json
+import os
+import threading
+import numpy as np
+
+class VectorStore:
+    """
+    Append-only store of L2-normalized float32 vectors, memory-mapped from disk.
+
+    Layout of `directory`:
+    - vectors.f32: raw (capacity x dim) float32 rows, grown by doubling
+    - meta.json:   {"dim": ...}
+    - keys.jsonl:  one JSON-encoded key per line (row i belongs to line i),
+                   appended by flush()
+    Keys are usually document hashes, so each document is stored once.
+    """
+
+    def __init__(self, directory, dim, initial_capacity=1024):
+        self.directory = directory
+        self.dim = dim
+        self._vector_path = os.path.join(directory, "vectors.f32")
+        self._meta_path = os.path.join(directory, "meta.json")
+        self._keys_path = os.path.join(directory, "keys.jsonl")
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        self.keys = []
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["dim"] != dim:
+                raise ValueError(f"Vector store at {directory} has dim {meta['dim']}, expected {dim}")
+            # Stores written before keys.jsonl kept the whole key list here
+            self.keys = meta.get("keys", [])
+        else:
+            with open(self._meta_path, "w", encoding="utf-8") as f:
+                json.dump({"dim": dim}, f)
+        self.keys += self._read_keys()
+        self._persisted = len(self.keys)
+        self._rows = {key: i for i, key in enumerate(self.keys)}
+        self._open(max(initial_capacity, len(self.keys)))
+
+    def _read_keys(self):
+        if not os.path.exists(self._keys_path):
+            return []
+        with open(self._keys_path, "rb+") as f:
+            data = f.read()
+            # Drop a line torn by a crash mid-flush, so the next append starts clean
+            end = data.rfind(b"\n") + 1
+            if end < len(data):
+                f.truncate(end)
+        return [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+
+    def _open(self, capacity):
+        row_bytes = self.dim * np.dtype(np.float32).itemsize
+        with open(self._vector_path, "ab") as f:
+            if f.tell() < capacity * row_bytes:
+                f.truncate(capacity * row_bytes)
+        capacity = os.path.getsize(self._vector_path) // row_bytes
+        self._vectors = np.memmap(self._vector_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self._rows
+
+    def add(self, keys, vectors):
+        """Stores vectors for keys not already present (existing keys are kept as-is)."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        with self._lock:
+            new = [(key, vec) for key, vec in zip(keys, vectors) if key not in self._rows]
+            if not new:
+                return
+            needed = len(self.keys) + len(new)
+            if needed > self._vectors.shape[0]:
+                self._vectors.flush()
+                self._open(max(needed, self._vectors.shape[0] * 2))
+
+            start = len(self.keys)
+            block = np.stack([vec for _, vec in new])
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            self._vectors[start:needed] = block / np.maximum(norms, 1e-12)
+            for i, (key, _) in enumerate(new):
+                self._rows[key] = start + i
+                self.keys.append(key)
+
+    def _view(self):
+        # add() may swap in a larger memmap: take the array and row count together.
+        # Rows below n are never rewritten, so reading them after the lock is safe.
+        with self._lock:
+            return self._vectors, len(self.keys)
+
+    def get(self, keys):
+        """Returns an array of vectors for `keys` (all must be present)."""
+        with self._lock:
+            rows = [self._rows[key] for key in keys]
+            vectors = self._vectors
+        return np.array(vectors[rows])
+
+    def search(self, query, k=10):
+        """Brute-force cosine search; returns [(key, score), ...] best first."""
+        vectors, n = self._view()
+        if n == 0:
+            return []
+        query = np.asarray(query, dtype=np.float32).ravel()
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        scores = vectors[:n] @ query
+
+        k = min(k, n)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.keys[i], float(scores[i])) for i in top]
+
+    def flush(self):
+        """Persists vectors, then appends keys added since the last flush to keys.jsonl."""
+        with self._lock:
+            new_keys = self.keys[self._persisted:]
+            if not new_keys:
+                return
+            # Vectors first: a key on disk always has its row on disk
+            self._vectors.flush()
+            with open(self._keys_path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(key) + "\n" for key in new_keys))
+            self._persisted = len(self.keys)
@@ -1,94 +1,42 @@
-from transformers import pipeline
+import os
 import random
 import re
+import threading
+from functools import lru_cache
 
-# Load distilgpt2 (Only used for unknown roles now)
-try:
-    generator = pipeline("text-generation", model="distilgpt2")
-except Exception:
-    generator = None
+from monitoring.metrics import timed
 
-# --- 1. FULL SKILL DATABASE (For Context & Fallback) ---
-SKILL_CATEGORIES = {
-    # === TECHNOLOGY ROLES ===
-    "Data Analyst": {
-        "sql", "excel", "tableau", "power bi", "python", "r", "pandas", "numpy", 
-        "data visualization", "statistics", "cleaning", "etl", "snowflake"
-    },
-    "Software Developer": {
-        "python", "java", "c++", "c#", "javascript", "typescript", "react", "node.js", 
-        "git", "docker", "agile", "sql", "dsa", "oop", "algorithms"
-    },
-    "Machine Learning Engineer": {
-        "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn", 
-        "nlp", "computer vision", "transformers", "mlops", "aws sagemaker", "model deployment"
-    },
-    "DevOps Engineer": {
-        "aws", "azure", "linux", "jenkins", "kubernetes", "docker", "terraform", 
-        "ansible", "ci/cd", "bash", "scripting", "monitoring", "prometheus", "grafana"
-    },
-    "Cybersecurity Analyst": {
-        "network security", "firewalls", "wireshark", "penetration testing", "siem", 
-        "linux", "cryptography", "risk assessment", "incident response", "compliance", "kali linux"
-    },
-    "Full Stack Developer": {
-        "html", "css", "javascript", "react", "angular", "node.js", "django", "flask", 
-        "mongodb", "sql", "rest api", "graphql", "aws", "git"
-    },
-    "Cloud Architect": {
-        "aws", "azure", "gcp", "cloud formation", "iam", "vpc", "ec2", "s3", 
-        "lambda", "microservices", "serverless", "distributed systems", "security"
-    },
-    "Network Engineer": {
-        "tcp/ip", "dns", "dhcp", "vpn", "routing", "switching", "cisco", "juniper", 
-        "firewalls", "lan", "wan", "subnetting", "wireshark"
-    },
-    "QA Automation Engineer": {
-        "selenium", "junit", "testng", "pytest", "cypress", "appium", "java", "python", 
-        "jenkins", "api testing", "postman", "jira", "agile"
-    },
-    "Product Manager": {
-        "product roadmap", "agile", "scrum", "user stories", "market research", "jira", 
-        "confluence", "stakeholder management", "analytics", "a/b testing", "ux"
-    },
-    "UI/UX Designer": {
-        "figma", "adobe xd", "sketch", "wireframing", "prototyping", "user research", 
-        "usability testing", "html", "css", "responsive design", "accessibility"
-    },
+# distilgpt2 is only used for unknown roles now, so it is loaded lazily on first use.
+# Set CAREERVANTAGE_GENERATOR_MODEL to another model name, or to "none" to disable it.
+GENERATOR_MODEL = os.environ.get("CAREERVANTAGE_GENERATOR_MODEL", "distilgpt2")
 
-    # === ACADEMIC & EDUCATION ROLES ===
-    "School Teacher": {
-        "classroom management", "lesson planning", "curriculum development", "student assessment",
-        "special education", "differentiated instruction", "child psychology", "edtech", 
-        "google classroom", "parent communication", "k-12", "literacy", "numeracy"
-    },
-    "PUC Lecturer": {
-        "subject expertise", "lecturing", "student counseling", "examination duties", 
-        "academic administration", "physics", "chemistry", "mathematics", "biology", 
-        "college admissions", "competitive exam coaching", "lab supervision"
-    },
-    "Engineering Lecturer": {
-        "teaching", "curriculum design", "research", "mentoring", "communication", 
-        "matlab", "simulink", "autocad", "academic writing", "presentation", "pedagogy"
-    },
+_generator = None
+_generator_loaded = False
+_generator_lock = threading.Lock()
 
-    # === MEDICAL & SCIENCE ROLES ===
-    "Doctor": {
-        "patient care", "diagnosis", "surgery", "treatment planning", "medical records", 
-        "emr", "clinical research", "public health", "emergency medicine", "pediatrics", 
-        "internal medicine", "medical ethics", "hipaa", "cardiology", "anatomy"
-    },
-    "Scientist": {
-        "hypothesis testing", "laboratory safety", "microscopy", "spectroscopy", 
-        "chromatography", "pcr", "molecular biology", "chemistry", "physics", 
-        "experimental design", "data analysis", "scientific writing", "peer review"
-    },
-    "Researcher": {
-        "literature review", "data collection", "statistical analysis", "spss", "qualitative research", 
-        "quantitative research", "grant writing", "publication", "surveys", "interviewing", 
-        "critical thinking", "ethics"
-    }
-}
+def get_generator():
+    """
+    Returns the text-generation pipeline, loading torch/transformers and the
+    model weights on the first call only. Returns None if disabled or unavailable.
+    """
+    global _generator, _generator_loaded
+    if _generator_loaded:
+        return _generator
+
+    with _generator_lock:
+        if not _generator_loaded:
+            if GENERATOR_MODEL and GENERATOR_MODEL.lower() != "none":
+                try:
+                    from transformers import pipeline
+                    _generator = pipeline("text-generation", model=GENERATOR_MODEL)
+                except Exception:
+                    _generator = None
+            _generator_loaded = True
+    return _generator
+
+# --- 1. FULL SKILL DATABASE (For Context & Fallback) ---
+# Shared with the skill extractor so the two can't drift apart
+from embeddings.skill_taxonomy import SKILL_CATEGORIES
 
 # --- 2. DIRECT COURSERA LINKS ---
 RESOURCE_DB = {
@@ -243,35 +191,18 @@ ROLE_PROJECTS = {
     )
 }
 
-def generate_recommendations(missing_skills, role):
-    # --- PART 1: COURSES ---
-    resource_text = "### 📚 Recommended Coursera Certifications:\n"
-    if missing_skills:
-        for skill in missing_skills:
-            link = RESOURCE_DB.get(skill.lower(), f"https://www.coursera.org/search?query={skill}")
-            resource_text += f"- **{skill.upper()}**: [View Course]({link})\n"
-    else:
-        resource_text += "- **LEADERSHIP**: [View Course](https://www.coursera.org/specializations/organizational-leadership)\n"
-
-    # --- PART 2: INTERNSHIPS ---
-    internship_advice = INTERNSHIP_DB.get("General")
+# --- 5. PRECOMPUTED LOOKUPS ---
+def _match_role(role):
+    """(internship advice, ROLE_PROJECTS key) for a role: exact match -> fuzzy match -> General."""
     # Fuzzy match role to Internship DB
-    matched_intern_role = "General"
+    internship_advice = INTERNSHIP_DB.get("General")
     for key in INTERNSHIP_DB:
         if key.lower() in role.lower():
             internship_advice = INTERNSHIP_DB[key]
             break
-            
-    internship_text = f"\n### 💼 Internship Recommendation:\n**Strategy:** {internship_advice}\n"
 
-    # --- PART 3: PROJECTS (Hardcoded Lookup) ---
-    # We bypass the AI generator to ensure 100% accurate, high-quality output
-    # customized for the specific role.
-    
-    matched_role = "General"
-    
     # Find best match in our ROLE_PROJECTS database
-    # Priority: Exact match -> Fuzzy match -> General
+    matched_role = "General"
     if role in ROLE_PROJECTS:
         matched_role = role
     else:
@@ -279,7 +210,39 @@ def generate_recommendations(missing_skills, role):
             if key.lower() in role.lower():
                 matched_role = key
                 break
-            
-    strategy_text = ROLE_PROJECTS[matched_role]
 
-    return f"{resource_text}{internship_text}\n###  Job Portfolio for {role}:\n{strategy_text}"
\ No newline at end of file
+    return internship_advice, matched_role
+
+# Every role the app can detect is resolved once at import
+_ROLE_MATCHES = {role: _match_role(role) for role in {*SKILL_CATEGORIES, *INTERNSHIP_DB, *ROLE_PROJECTS}}
+
+@lru_cache(maxsize=1024)
+def _course_line(skill):
+    link = RESOURCE_DB.get(skill.lower(), f"https://www.coursera.org/search?query={skill}")
+    return f"- **{skill.upper()}**: [View Course]({link})\n"
+
+@lru_cache(maxsize=4096)
+def _render_recommendations(missing_skills, role):
+    # --- PART 1: COURSES ---
+    parts = ["### 📚 Recommended Coursera Certifications:\n"]
+    if missing_skills:
+        parts.extend(_course_line(skill) for skill in sorted(missing_skills))
+    else:
+        parts.append("- **LEADERSHIP**: [View Course](https://www.coursera.org/specializations/organizational-leadership)\n")
+
+    # --- PART 2: INTERNSHIPS ---
+    internship_advice, matched_role = _ROLE_MATCHES.get(role) or _match_role(role)
+    parts.append(f"\n### 💼 Internship Recommendation:\n**Strategy:** {internship_advice}\n")
+
+    # --- PART 3: PROJECTS (Hardcoded Lookup) ---
+    # We bypass the AI generator to ensure 100% accurate, high-quality output
+    # customized for the specific role.
+    parts.append(f"\n###  Job Portfolio for {role}:\n{ROLE_PROJECTS[matched_role]}")
+
+    return "".join(parts)
+
+@timed("generate_recommendations")
+def generate_recommendations(missing_skills, role):
+    # Output depends only on the set of missing skills and the role, so whole
+    # results are memoized (courses are listed in sorted order)
+    return _render_recommendations(frozenset(missing_skills or ()), role)
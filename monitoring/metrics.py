@@ -0,0 +1,229 @@
+# monitoring/metrics.py
+import cProfile
+import functools
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Latency buckets in seconds (upper bounds), Prometheus-style
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+class MetricsRegistry:
+    """In-process counters and histograms, keyed by metric name + labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def record_stage(self, seconds_key, calls_key, seconds, errors_key=None):
+        """Hot path for timed(): histogram + counters under a single lock, keys prebuilt."""
+        with self._lock:
+            histogram = self.histograms.get(seconds_key)
+            if histogram is None:
+                histogram = self.histograms[seconds_key] = Histogram()
+            histogram.observe(seconds)
+            self.counters[calls_key] = self.counters.get(calls_key, 0) + 1
+            if errors_key is not None:
+                self.counters[errors_key] = self.counters.get(errors_key, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def drain(self):
+        """
+        Returns everything recorded so far as plain (picklable) data and clears
+        the registry. Worker processes ship this to the parent, which merge()s it.
+        """
+        with self._lock:
+            state = {
+                "counters": dict(self.counters),
+                "histograms": {key: (h.buckets, list(h.counts), h.count, h.sum)
+                               for key, h in self.histograms.items()},
+            }
+            self.counters.clear()
+            self.histograms.clear()
+        return state
+
+    def merge(self, state):
+        """Adds a drain() result (e.g. from a worker process) into this registry."""
+        with self._lock:
+            for key, value in state["counters"].items():
+                self.counters[key] = self.counters.get(key, 0) + value
+            for key, (buckets, counts, count, total) in state["histograms"].items():
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = self.histograms[key] = Histogram(buckets)
+                if histogram.buckets != tuple(buckets):
+                    raise ValueError(f"Histogram buckets differ for {key[0]}")
+                histogram.counts = [a + b for a, b in zip(histogram.counts, counts)]
+                histogram.count += count
+                histogram.sum += total
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in self.counters.items()
+                ],
+                "histograms": [
+                    {"name": name, "labels": dict(labels), "count": h.count, "sum": h.sum,
+                     "buckets": dict(zip([str(b) for b in h.buckets] + ["+Inf"], h.counts))}
+                    for (name, labels), h in self.histograms.items()
+                ],
+            }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self):
+        """Prometheus text exposition format."""
+        def fmt(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}" if pairs else ""
+
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self.counters}):
+                lines.append(f"# TYPE {name} counter")
+                for (n, labels), value in self.counters.items():
+                    if n == name:
+                        lines.append(f"{name}{fmt(labels)} {value}")
+            for name in sorted({name for name, _ in self.histograms}):
+                lines.append(f"# TYPE {name} histogram")
+                for (n, labels), h in self.histograms.items():
+                    if n != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip([str(b) for b in h.buckets] + ["+Inf"], h.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{fmt(labels, [('le', bound)])} {cumulative}")
+                    lines.append(f"{name}_sum{fmt(labels)} {h.sum}")
+                    lines.append(f"{name}_count{fmt(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+# Process-wide registry used by the pipeline stages
+REGISTRY = MetricsRegistry()
+
+class timed:
+    """
+    Times a pipeline stage into the registry. Use as a decorator
+    (@timed("extract_skills")) or a context manager (with timed("parse"): ...).
+    Records careervantage_stage_seconds, _calls_total and _errors_total.
+    """
+
+    def __init__(self, stage, registry=None):
+        self.stage = stage
+        self.registry = registry or REGISTRY
+        labels = (("stage", stage),)
+        self._keys = (
+            ("careervantage_stage_seconds", labels),
+            ("careervantage_stage_calls_total", labels),
+            ("careervantage_stage_errors_total", labels),
+        )
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds_key, calls_key, errors_key = self._keys
+        self.registry.record_stage(seconds_key, calls_key, time.perf_counter() - self._start,
+                                   errors_key if exc_type is not None else None)
+        return False
+
+    def __call__(self, fn):
+        record_stage = self.registry.record_stage
+        seconds_key, calls_key, errors_key = self._keys
+
+        # Timing lives on the wrapper's stack, so concurrent/recursive calls stay independent
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                record_stage(seconds_key, calls_key, time.perf_counter() - start, errors_key)
+                raise
+            record_stage(seconds_key, calls_key, time.perf_counter() - start)
+            return result
+        return wrapper
+
+class ProfileCapture:
+    """Results of profile_request(): cProfile stats and tracemalloc memory usage."""
+
+    def __init__(self):
+        self.profile = None
+        self.peak_memory = None
+        self.top_allocations = []
+
+    def stats_text(self, limit=30, sort="cumulative"):
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def to_dict(self, limit=30):
+        """Plain-data summary (picklable, JSON-friendly)."""
+        return {"stats": self.stats_text(limit), "peak_memory": self.peak_memory,
+                "top_allocations": self.top_allocations}
+
+@contextmanager
+def profile_request(memory=True):
+    """
+    Opt-in capture for a single request: profiles the block with cProfile and,
+    if `memory`, traces allocations with tracemalloc (both add overhead).
+    """
+    capture = ProfileCapture()
+    capture.profile = cProfile.Profile()
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    capture.profile.enable()
+    try:
+        yield capture
+    finally:
+        capture.profile.disable()
+        if memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            capture.peak_memory = tracemalloc.get_traced_memory()[1]
+            capture.top_allocations = [str(stat) for stat in snapshot.statistics("lineno")[:10]]
+            if started_tracing:
+                tracemalloc.stop()
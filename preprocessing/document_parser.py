@@ -0,0 +1,162 @@
+# preprocessing/document_parser.py
+import io
+import mmap
+import os
+import zipfile
+from html.parser import HTMLParser
+
+from preprocessing.resume_parser import iter_resume_pages, MAX_RESUME_CHARS
+from monitoring.metrics import timed
+
+# Extensions picked up when scanning a folder; the format itself is always sniffed from the bytes
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".txt", ".html", ".htm")
+
+# name -> (sniff(head_bytes, data) -> bool, parse(data, max_pages) -> iterator of text chunks)
+PARSERS = {}
+
+def register_parser(name, sniff):
+    """Decorator: registers a parser; formats are tried in registration order."""
+    def decorator(parse):
+        PARSERS[name] = (sniff, parse)
+        return parse
+    return decorator
+
+def detect_format(data):
+    """Name of the first registered format whose magic bytes match `data`, or None."""
+    head = bytes(data[:1024])
+    for name, (sniff, _) in PARSERS.items():
+        if sniff(head, data):
+            return name
+    return None
+
+# --- PDF ---
+@register_parser("pdf", lambda head, data: b"%PDF-" in head)
+def _parse_pdf(data, max_pages=None):
+    return iter_resume_pages(_as_stream(data), max_pages=max_pages, max_chars=0)
+
+# --- DOCX (a zip container with word/document.xml) ---
+def _is_docx(head, data):
+    if not head.startswith(b"PK\x03\x04"):
+        return False
+    try:
+        with zipfile.ZipFile(_as_stream(data)) as archive:
+            return "word/document.xml" in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+@register_parser("docx", _is_docx)
+def _parse_docx(data, max_pages=None):
+    import docx
+
+    document = docx.Document(_as_stream(data))
+    for paragraph in document.paragraphs:
+        yield paragraph.text + "\n"
+    for table in document.tables:
+        for row in table.rows:
+            yield " | ".join(cell.text for cell in row.cells) + "\n"
+
+# --- HTML ---
+# Tags that end a line in the rendered page; a break is emitted so adjacent words don't merge
+_BREAK_TAGS = {
+    "br", "p", "div", "li", "ul", "ol", "tr", "td", "th", "table", "section", "article",
+    "header", "footer", "h1", "h2", "h3", "h4", "h5", "h6", "dt", "dd", "blockquote", "pre", "hr",
+}
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+        elif tag in _BREAK_TAGS:
+            self.chunks.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+        elif tag in _BREAK_TAGS:
+            self.chunks.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.chunks.append(data)
+
+def _is_html(head, data):
+    # Only at the start of the document: a text resume may mention "<html" anywhere
+    start = head.removeprefix(b"\xef\xbb\xbf").lstrip(b" \t\r\n").lower()
+    return start.startswith((b"<!doctype html", b"<html"))
+
+@register_parser("html", _is_html)
+def _parse_html(data, max_pages=None):
+    parser = _TextExtractor()
+    parser.feed(bytes(data).decode("utf-8", errors="replace"))
+    parser.close()
+    return iter(parser.chunks)
+
+# --- Plain text (fallback: anything without NUL bytes) ---
+@register_parser("txt", lambda head, data: b"\x00" not in head)
+def _parse_txt(data, max_pages=None):
+    yield bytes(data).decode("utf-8-sig", errors="replace")
+
+class _MmapFile:
+    """Read-only file view of an mmap without copying it; mmap only has seekable() from Python 3.13."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def seekable(self):
+        return True
+
+    def __getattr__(self, name):
+        return getattr(self._data, name)
+
+def _as_stream(data):
+    # PdfReader and zipfile only need read/seek/tell (+ seekable), so an mmap is
+    # read in place; bytes and memoryviews are wrapped in a BytesIO
+    if hasattr(data, "seekable"):
+        return data
+    if isinstance(data, mmap.mmap):
+        return _MmapFile(data)
+    return io.BytesIO(data)
+
+def iter_document_text(data, max_pages=None, max_chars=None):
+    """
+    Sniffs the format of `data` (bytes, memoryview or mmap) and yields its
+    text in chunks (pages for PDF), stopping after `max_chars` characters.
+    Raises ValueError for unsupported formats.
+    """
+    name = detect_format(data)
+    if name is None:
+        raise ValueError("Unsupported document format")
+    max_chars = MAX_RESUME_CHARS if max_chars is None else max_chars
+
+    total = 0
+    for chunk in PARSERS[name][1](data, max_pages):
+        if max_chars:
+            chunk = chunk[:max_chars - total]
+        total += len(chunk)
+        yield chunk
+        if max_chars and total >= max_chars:
+            break
+
+@timed("parse_document")
+def extract_document_text(source, max_pages=None, max_chars=None):
+    """
+    Text of a resume in any registered format. `source` is a path (read via
+    mmap), raw bytes / memoryview, or a file-like upload.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return "".join(iter_document_text(data, max_pages, max_chars))
+
+    if hasattr(source, "getvalue"):
+        source = source.getvalue()
+    elif hasattr(source, "read"):
+        source = source.read()
+    return "".join(iter_document_text(source, max_pages, max_chars))
@@ -0,0 +1,128 @@
+# preprocessing/resume_cache.py
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from preprocessing.document_parser import iter_document_text
+from preprocessing.text_cleaner import clean_text_for_analysis
+from embeddings.skill_extractor import extract_skills_streaming
+from monitoring.metrics import timed
+
+def resume_digest(resume_bytes):
+    """Content address of a resume: SHA-256 of the raw file bytes."""
+    return hashlib.sha256(resume_bytes).hexdigest()
+
+class ResumeCache:
+    """
+    Two-tier cache of parsed resumes keyed by resume_digest():
+    - an in-memory LRU of at most `max_entries` items
+    - an optional SQLite file (`db_path`) trimmed to `max_disk_bytes`,
+      least recently used rows first
+    Values are dicts with "text", "clean_text" and "skills".
+    """
+
+    def __init__(self, max_entries=256, db_path=None, max_disk_bytes=256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS resumes ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            if self._db is None:
+                return None
+
+            row = self._db.execute("SELECT payload FROM resumes WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE resumes SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            value = self._decode(row[0])
+            self._remember(key, value)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+            if self._db is None:
+                return
+            payload = json.dumps({
+                "text": value["text"],
+                "clean_text": value["clean_text"],
+                "skills": sorted(value["skills"]),
+            })
+            self._db.execute(
+                "INSERT OR REPLACE INTO resumes (key, payload, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time()),
+            )
+            self._evict_disk()
+            self._db.commit()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM resumes").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        rows = self._db.execute("SELECT key, size FROM resumes ORDER BY last_access").fetchall()
+        stale = []
+        for key, size in rows:
+            if total <= self.max_disk_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM resumes WHERE key = ?", stale)
+
+    @staticmethod
+    def _decode(payload):
+        value = json.loads(payload)
+        value["skills"] = set(value["skills"])
+        return value
+
+# Process-wide default (memory only)
+default_cache = ResumeCache()
+
+@timed("parse_resume_cached")
+def parse_resume_bytes(resume_bytes, cache=None):
+    """
+    Parses a resume (any format in preprocessing.document_parser) and extracts
+    its skills, skipping all work if the same bytes were seen before. Returns
+    a dict with "sha256", "text", "clean_text" and "skills" (a set).
+    """
+    cache = cache or default_cache
+    key = resume_digest(resume_bytes)
+
+    value = cache.get(key)
+    if value is None:
+        # Skills are matched chunk by chunk (PDF: page by page) as the text is extracted
+        chunks, skills = [], set()
+        for chunk, skills in extract_skills_streaming(iter_document_text(resume_bytes)):
+            chunks.append(chunk)
+        text = "".join(chunks)
+        value = {
+            "text": text,
+            "clean_text": clean_text_for_analysis(text),
+            "skills": skills,
+        }
+        cache.put(key, value)
+
+    return {"sha256": key, **value}
@@ -1,5 +1,160 @@
 #resume_praser.py
-from PyPDF2 import PdfReader
-def extract_resume_text(path):
+import os
+import signal
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from monitoring.metrics import timed
+try:
+    # PyPDF2 stays the default: ~2x faster text extraction than pypdf (benchmarks/bench_pdf_backends.py)
+    from PyPDF2 import PdfReader
+except ImportError:
+    # pypdf is its maintained successor with the same reader API
+    from pypdf import PdfReader
+
+# Early cutoff for very long CVs / scanned portfolios (0 disables a limit)
+MAX_RESUME_PAGES = int(os.environ.get("CAREERVANTAGE_MAX_RESUME_PAGES", 20))
+MAX_RESUME_CHARS = int(os.environ.get("CAREERVANTAGE_MAX_RESUME_CHARS", 200_000))
+
+def iter_resume_pages(path, max_pages=None, max_chars=None):
+    """
+    Yields the text of each page as it is extracted, stopping after
+    `max_pages` pages or `max_chars` characters (module defaults if None).
+    """
+    max_pages = MAX_RESUME_PAGES if max_pages is None else max_pages
+    max_chars = MAX_RESUME_CHARS if max_chars is None else max_chars
+
     reader = PdfReader(path)
-    return "".join([p.extract_text() for p in reader.pages])
\ No newline at end of file
+    total = 0
+    for i, page in enumerate(reader.pages):
+        if max_pages and i >= max_pages:
+            break
+        text = page.extract_text() or ""
+        if max_chars:
+            text = text[:max_chars - total]
+        total += len(text)
+        yield text
+        if max_chars and total >= max_chars:
+            break
+
+@timed("parse_pdf")
+def extract_resume_text(path, max_pages=None, max_chars=None):
+    return "".join(iter_resume_pages(path, max_pages, max_chars))
+
+def _raise_timeout(signum, frame):
+    raise TimeoutError("PDF parsing timed out")
+
+def parse_resume_file(path, timeout=None):
+    """
+    Parses one resume file with an optional time limit (seconds). Never raises:
+    returns (path, text, error) with error=None on success. Safe to run in pool workers.
+    """
+    # Imported here: document_parser builds on this module
+    from preprocessing.document_parser import extract_document_text
+
+    # SIGALRM interrupts the (pure-Python) PDF parser, so one huge file can't hold a worker
+    use_alarm = bool(timeout) and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return path, extract_document_text(path), None
+    except Exception as e:
+        return path, "", f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+def iter_resume_paths(source):
+    """A directory's supported resume files (sorted), or the given iterable of paths as-is."""
+    from preprocessing.document_parser import SUPPORTED_EXTENSIONS
+
+    if isinstance(source, (str, os.PathLike)) and os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield os.path.join(source, name)
+    else:
+        yield from source
+
+def run_in_pool(fn, items, workers=None, *args):
+    """
+    Runs fn(item, *args) for each item in a process pool and yields
+    (item, result, error) in completion order. Only a few tasks per worker are
+    queued at a time, so memory stays flat for very large inputs.
+
+    If a worker process dies (OOM kill, segfault in a C extension) the pool is
+    rebuilt and the items that were in flight are retried one at a time, so
+    only the item that kills a worker on its own is reported as failed.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 4
+    items = iter(items)
+    suspects = deque()  # in flight when a worker died
+    pending = {}
+    isolated = False  # the only pending task is a suspect retried alone
+    pool = None
+
+    try:
+        while True:
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=workers)
+            crashed = []
+            try:
+                if suspects:
+                    if not pending:
+                        item = suspects.popleft()
+                        pending[pool.submit(fn, item, *args)] = item
+                        isolated = True
+                else:
+                    for item in items:
+                        pending[pool.submit(fn, item, *args)] = item
+                        if len(pending) >= max_pending:
+                            break
+            except BrokenProcessPool:
+                # The pool broke before this item was submitted; it never ran
+                suspects.append(item)
+                crashed.append(None)
+            if not pending and not crashed:
+                break
+
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        crashed.append(item)
+                        continue
+                    except Exception as e:
+                        yield item, None, f"{type(e).__name__}: {e}"
+                        continue
+                    yield item, result, None
+
+            if crashed:
+                if isolated and crashed[0] is not None:
+                    yield crashed[0], None, "BrokenProcessPool: worker process died while processing this item"
+                else:
+                    suspects.extend(item for item in crashed if item is not None)
+                    suspects.extend(pending.values())
+                pending.clear()
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = None
+            if not pending:
+                isolated = False
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+def parse_resumes(source, workers=None, timeout=60):
+    """
+    Parses many resumes (PDF, DOCX, TXT, HTML) in a process pool.
+
+    `source` is a directory (all supported files in it) or an iterable of paths.
+    Yields (path, text, error) tuples in completion order; `error` is None on
+    success, otherwise a short message and `text` is "". `timeout` is the
+    per-file limit in seconds (None disables it).
+    """
+    paths = (str(path) for path in iter_resume_paths(source))
+    for path, result, error in run_in_pool(parse_resume_file, paths, workers, timeout):
+        yield result if error is None else (path, "", error)
@@ -1,5 +1,15 @@
 # preprocessing/text_cleaner.py
-import re
+
+# Confusing characters FPDF can't render, built once (smart quotes, dashes, bullets)
+PDF_REPLACEMENTS = {
+    u'\u201c': '"', u'\u201d': '"',  # Smart quotes
+    u'\u2018': "'", u'\u2019': "'",  # Smart single quotes
+    u'\u2013': '-', u'\u2014': '-',  # Dashes
+    u'\u2022': '*',                  # Bullets
+}
+
+# Joins a batch into one string; texts containing it are cleaned one by one
+_BATCH_SEPARATOR = "\x00"
 
 def clean_text_for_pdf(text):
     """
@@ -8,15 +18,14 @@ def clean_text_for_pdf(text):
     """
     if not text:
         return ""
+
+    # Plain ASCII needs no replacement and survives Latin-1 untouched
+    if text.isascii():
+        return text
         
     # 1. Replace confusing characters (smart quotes, dashes)
-    replacements = {
-        u'\u201c': '"', u'\u201d': '"',  # Smart quotes
-        u'\u2018': "'", u'\u2019': "'",  # Smart single quotes
-        u'\u2013': '-', u'\u2014': '-',  # Dashes
-        u'\u2022': '*',                  # Bullets
-    }
-    for search, replace in replacements.items():
+    # (a few C-level str.replace passes beat a dict-based str.translate here)
+    for search, replace in PDF_REPLACEMENTS.items():
         text = text.replace(search, replace)
 
     # 2. Encode to Latin-1 to strip emojis (replaces them with '?')
@@ -30,6 +39,36 @@ def clean_text_for_analysis(text):
     if not text:
         return ""
     
-    # Remove extra newlines and spaces
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
\ No newline at end of file
+    # Remove extra newlines and spaces (same as re.sub(r'\s+', ' ', text).strip())
+    return " ".join(text.split())
+
+def clean_texts_for_pdf(texts):
+    """
+    Batch clean_text_for_pdf. ASCII texts pass through untouched; the rest
+    are joined and cleaned in one pass, then split back. Returns a list in
+    input order.
+    """
+    texts = [text or "" for text in texts]
+    dirty = [i for i, text in enumerate(texts) if not text.isascii()]
+    if not dirty:
+        return texts
+
+    joined = _BATCH_SEPARATOR.join(texts[i] for i in dirty)
+    if joined.count(_BATCH_SEPARATOR) != len(dirty) - 1:
+        cleaned = [clean_text_for_pdf(texts[i]) for i in dirty]
+    else:
+        cleaned = clean_text_for_pdf(joined).split(_BATCH_SEPARATOR)
+    for i, text in zip(dirty, cleaned):
+        texts[i] = text
+    return texts
+
+def clean_texts_for_analysis(texts):
+    """
+    Batch clean_text_for_analysis. Accepts any iterable of strings (None / NaN
+    are treated as empty); a pandas Series comes back as a Series with the same index.
+    """
+    # isinstance also catches NaN, which pandas uses for missing values
+    cleaned = [" ".join(text.split()) if isinstance(text, str) else "" for text in texts]
+    if hasattr(texts, "index") and hasattr(texts, "to_list"):
+        return type(texts)(cleaned, index=texts.index)
+    return cleaned
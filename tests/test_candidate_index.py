@@ -0,0 +1,38 @@
+# tests/test_candidate_index.py
+import pytest
+
+pytest.importorskip("sklearn")
+
+from embeddings.candidate_index import SkillIndex, shortlist_candidates
+from embeddings.batch_screener import screen_batch, screen_candidates
+from embeddings.skill_extractor import extract_skills
+from benchmarks.eval_candidate_recall import tie_aware_recall
+
+RESUMES = ["python developer with ledger experience", "accountant, ledger, excel", "sql and python"]
+
+def _index(resumes):
+    index = SkillIndex()
+    for candidate_id, text in enumerate(resumes):
+        index.add(candidate_id, extract_skills(text))
+    return index
+
+def test_jd_without_taxonomy_skills_falls_back_to_exhaustive():
+    jd = "accountant with ledger experience"
+    shortlisted = screen_candidates(jd, _index(RESUMES), RESUMES.__getitem__)
+    exhaustive = screen_batch(jd, RESUMES)
+    assert [r["candidate_id"] for r in shortlisted] == [r["candidate_id"] for r in exhaustive]
+
+def test_shortlist_is_filled_up_to_limit():
+    index = _index(RESUMES)
+    assert shortlist_candidates({"sql"}, index, limit=2) == [2, 0]
+    assert shortlist_candidates({"sql"}, index, limit=10) == [2, 0, 1]
+
+def _ranked(*scores):
+    return [{"candidate_id": i, "ats_score": s} for i, s in enumerate(scores)]
+
+def test_tie_aware_recall_requires_candidates_above_the_cutoff():
+    exhaustive = _ranked(0.9, 0.8, 0.8, 0.8)
+    # Top-2: candidate 0 is required, one of the tied ones fills the other slot
+    assert tie_aware_recall(exhaustive, [exhaustive[0], exhaustive[3]], 2) == 1.0
+    # Missing the strictly-better candidate is not made up for by two tied ones
+    assert tie_aware_recall(exhaustive, [exhaustive[1], exhaustive[2]], 2) == 0.5
@@ -0,0 +1,107 @@
+# tests/test_candidate_store.py
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from embeddings.candidate_store import CandidateStore
+from embeddings.skill_taxonomy import TAXONOMY
+
+def _expected(live, jd_skills):
+    counts = {cid: len(skills & jd_skills) for cid, skills in live.items()}
+    return {cid: n for cid, n in counts.items() if n}
+
+def _check(store, live, jd_skills, limit=10_000):
+    hits = store.search(jd_skills, limit)
+    assert dict(hits) == _expected(live, jd_skills)
+    assert [n for _, n in hits] == sorted((n for _, n in hits), reverse=True)
+
+@pytest.mark.parametrize("compact_ratio,max_segments", [(0.3, 8), (10.0, 1000), (10.0, 3)])
+def test_search_matches_live_documents(compact_ratio, max_segments):
+    rng = random.Random(0)
+    skills = list(TAXONOMY.skills)
+    store = CandidateStore(compact_ratio=compact_ratio, max_segments=max_segments)
+    live = {}
+    for _ in range(30):
+        for _ in range(rng.randint(1, 40)):
+            cid = f"c{rng.randint(0, 150)}"
+            if cid in live and rng.random() < 0.3:
+                store.delete(cid)
+                del live[cid]
+            else:
+                candidate_skills = set(rng.sample(skills, rng.randint(0, 12)))
+                store.add_text(cid, " ".join(candidate_skills), skills=candidate_skills)
+                live[cid] = candidate_skills
+        store.refresh()
+        assert len(store) == len(live)
+        _check(store, live, set(rng.sample(skills, 10)))
+    for cid, candidate_skills in live.items():
+        assert store.get_skills(cid) == candidate_skills
+
+def test_search_limit_keeps_best_matches():
+    store = CandidateStore()
+    skills = list(TAXONOMY.skills)[:5]
+    for n in range(1, 6):
+        store.add_text(f"c{n}", "", skills=skills[:n])
+    store.refresh()
+    assert store.search(set(skills), limit=2) == [("c5", 5), ("c4", 4)]
+
+def test_log_replay_restores_live_documents(tmp_path):
+    log_path = str(tmp_path / "store.jsonl")
+    skills = list(TAXONOMY.skills)[:3]
+    with CandidateStore(log_path=log_path) as store:
+        store.add_text("a", "", skills=skills)
+        store.add_text("b", "", skills=skills[:1])
+        store.add_text("a", "", skills=skills[:2])
+        store.delete("b")
+    store = CandidateStore(log_path=log_path)
+    assert store.search(set(skills)) == [("a", 2)]
+    store.close()
+
+def test_segment_limit_merges_only_recent_segments():
+    skills = list(TAXONOMY.skills)
+    store = CandidateStore(compact_ratio=10.0, max_segments=4)
+    for i in range(1000):
+        store.add_text(f"base{i}", "", skills=skills[:3])
+    store.refresh()
+    base = store._snapshot.segments[0]
+    for i in range(50):
+        store.add_text(f"new{i}", "", skills=skills[:1])
+        store.refresh()
+        assert len(store._snapshot.segments) <= 4
+    assert store._snapshot.segments[0] is base  # the big segment was never rebuilt
+    assert len(store.search({skills[0]}, limit=10_000)) == 1050
+
+def test_log_rewrite_keeps_writes_made_during_compaction(tmp_path):
+    log_path = str(tmp_path / "store.jsonl")
+    skills = list(TAXONOMY.skills)[:2]
+    store = CandidateStore(log_path=log_path, compact_ratio=0.0)
+    store.add_text("a", "", skills=skills)
+    store.refresh()
+    store.add_text("b", "", skills=skills)  # unpublished when compaction rewrites the log
+    store.compact()
+    store.add_text("c", "", skills=skills)
+    store.close()
+    replayed = CandidateStore(log_path=log_path)
+    assert sorted(cid for cid, _ in replayed.search(set(skills))) == ["a", "b", "c"]
+    replayed.close()
+
+def test_deleted_candidates_are_skipped_when_loading():
+    pytest.importorskip("sklearn")
+    from embeddings.batch_screener import screen_candidates
+
+    store = CandidateStore()
+    store.add_text("a", "python and sql developer")
+    store.add_text("b", "python developer")
+    store.refresh()
+    def load_text(candidate_id):
+        # "b" is deleted after search() shortlisted it, before its text is loaded
+        if candidate_id == "b":
+            store.delete("b")
+            store.refresh()
+        return store.get_text(candidate_id)
+
+    results = screen_candidates("python sql", store, load_text)
+    assert store.get_text("b") is None
+    assert [r["candidate_id"] for r in results] == ["a"]
@@ -0,0 +1,73 @@
+# tests/test_cli.py
+import json
+
+import pytest
+
+pytest.importorskip("sklearn")
+
+from app.cli import main
+
+@pytest.fixture
+def resume_dir(tmp_path):
+    for folder, name in [("a", "r.txt"), ("b", "r.txt"), ("b", "r.html")]:
+        (tmp_path / folder).mkdir(exist_ok=True)
+        (tmp_path / folder / name).write_text("Python developer with SQL and Docker experience")
+    jd = tmp_path / "jd.txt"
+    jd.write_text("Looking for a Python developer: SQL, Docker, AWS")
+    return tmp_path
+
+def _run(resume_dir, out, *extra):
+    main(["--jd", str(resume_dir / "jd.txt"), "--resumes", str(resume_dir / "a"), str(resume_dir / "b"),
+          "--out", str(out), "--workers", "1", *extra])
+
+def _rows(out):
+    with open(out, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def test_candidate_ids_are_unique_relative_paths(resume_dir):
+    out = resume_dir / "results.jsonl"
+    _run(resume_dir, out)
+    assert sorted(row["candidate_id"] for row in _rows(out)) == ["a/r.txt", "b/r.html", "b/r.txt"]
+
+def test_fresh_run_replaces_output(resume_dir):
+    out = resume_dir / "results.jsonl"
+    _run(resume_dir, out)
+    _run(resume_dir, out)
+    assert len(_rows(out)) == 3
+
+def test_resume_appends_only_missing_rows(resume_dir):
+    out = resume_dir / "results.jsonl"
+    _run(resume_dir, out)
+    (resume_dir / "a" / "new.txt").write_text("Docker and AWS")
+    _run(resume_dir, out, "--resume")
+    assert sorted(row["candidate_id"] for row in _rows(out)) == ["a/new.txt", "a/r.txt", "b/r.html", "b/r.txt"]
+
+def test_csv_fresh_run_replaces_output(resume_dir):
+    out = resume_dir / "results.csv"
+    _run(resume_dir, out)
+    _run(resume_dir, out)
+    assert len(out.read_text(encoding="utf-8").splitlines()) == 1 + 3
+
+def test_resume_keeps_ids_when_inputs_widen(resume_dir):
+    out = resume_dir / "results.jsonl"
+    main(["--jd", str(resume_dir / "jd.txt"), "--resumes", str(resume_dir / "a"),
+          "--out", str(out), "--workers", "1"])
+    assert [row["candidate_id"] for row in _rows(out)] == ["r.txt"]
+    # A new sibling folder would move the shared root; the checkpointed root is kept instead
+    _run(resume_dir, out, "--resume")
+    assert sorted(row["candidate_id"] for row in _rows(out)) == ["../b/r.html", "../b/r.txt", "r.txt"]
+
+def test_explicit_root(resume_dir):
+    out = resume_dir / "results.jsonl"
+    _run(resume_dir, out, "--root", str(resume_dir.parent))
+    assert all(row["candidate_id"].startswith(resume_dir.name + "/") for row in _rows(out))
+
+def test_scores_use_the_batch_scorer(resume_dir):
+    from embeddings.batch_screener import prepare_jd, score_resume
+
+    out = resume_dir / "results.jsonl"
+    _run(resume_dir, out)
+    jd_state = prepare_jd((resume_dir / "jd.txt").read_text())
+    text = (resume_dir / "a" / "r.txt").read_text()
+    row = next(row for row in _rows(out) if row["candidate_id"] == "a/r.txt")
+    assert row["ats_score"] == pytest.approx(score_resume(text, jd_state)["ats_score"], abs=1e-6)
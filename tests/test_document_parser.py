@@ -0,0 +1,89 @@
+# tests/test_document_parser.py
+import importlib.util
+import zipfile
+
+import pytest
+
+# document_parser builds on resume_parser, which needs a PDF reader (pypdf or PyPDF2)
+if not (importlib.util.find_spec("pypdf") or importlib.util.find_spec("PyPDF2")):
+    pytest.skip("pypdf / PyPDF2 not installed", allow_module_level=True)
+
+from preprocessing.document_parser import detect_format, extract_document_text
+from embeddings.skill_extractor import extract_skills
+
+def _write_docx(path, paragraphs):
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    document.save(path)
+
+def _write_pdf(path, text):
+    fpdf = pytest.importorskip("fpdf")
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=12)
+    pdf.cell(0, 10, text)
+    pdf.output(str(path))
+
+def test_pdf_from_path(tmp_path):
+    path = tmp_path / "r.pdf"
+    _write_pdf(path, "Skills: Python, SQL, Docker")
+    assert detect_format(path.read_bytes()) == "pdf"
+    text = extract_document_text(str(path))
+    assert {"python", "sql", "docker"} <= extract_skills(text)
+    assert extract_document_text(path.read_bytes()) == text
+
+def test_mmap_is_read_in_place(tmp_path):
+    import io
+    import mmap
+
+    from preprocessing.document_parser import _as_stream
+
+    path = tmp_path / "r.txt"
+    path.write_bytes(b"python")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        stream = _as_stream(data)
+        assert not isinstance(stream, io.BytesIO)
+        assert stream.seekable() and stream.read() == b"python"
+
+def test_docx_is_sniffed_from_mmapped_path(tmp_path):
+    # A bare zip with word/document.xml is enough for sniffing (no python-docx needed)
+    path = tmp_path / "r.docx"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("word/document.xml", "<w:document/>")
+    with open(path, "rb") as f:
+        assert detect_format(f.read()) == "docx"
+    # Goes through the mmap path; must not raise on Python < 3.13
+    try:
+        extract_document_text(str(path))
+    except AttributeError as e:
+        pytest.fail(f"mmap passed to zipfile: {e}")
+    except Exception:
+        pass  # not a valid Word document body; only the mmap handling is under test
+
+def test_docx_from_path(tmp_path):
+    path = tmp_path / "r.docx"
+    _write_docx(path, ["Skills: Python, SQL", "Docker"])
+    text = extract_document_text(str(path))
+    assert "Python, SQL" in text
+    assert {"python", "sql", "docker"} <= extract_skills(text)
+
+def test_html_block_tags_separate_words():
+    html = b"<html><body><p>python<br>sql</p><table><tr><td>docker</td><td>aws</td></tr></table></body></html>"
+    text = extract_document_text(html)
+    assert {"python", "sql", "docker", "aws"} <= extract_skills(text)
+
+def test_html_skips_scripts():
+    html = b"<html><script>var java = 1;</script><p>sql</p></html>"
+    assert extract_skills(extract_document_text(html)) == {"sql"}
+
+def test_text_mentioning_html_tag_is_txt():
+    text = b"Frontend developer. Built pages from <html> templates with Python and SQL."
+    assert detect_format(text) == "txt"
+    assert "<html>" in extract_document_text(text)
+
+@pytest.mark.parametrize("prefix", [b"", b"\xef\xbb\xbf", b"\n  \t", b"\xef\xbb\xbf\r\n"])
+def test_html_detected_at_document_start(prefix):
+    assert detect_format(prefix + b"<!DOCTYPE html><p>sql</p>") == "html"
+    assert detect_format(prefix + b"<HTML><p>sql</p></HTML>") == "html"
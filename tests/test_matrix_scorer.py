@@ -0,0 +1,49 @@
+# tests/test_matrix_scorer.py
+import random
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from embeddings.matrix_scorer import MatrixScorer
+from embeddings.similarity_engine import ATSScorer
+from embeddings.skill_extractor import extract_skills, compare_skills
+from embeddings.skill_taxonomy import SKILL_CATEGORIES
+from benchmarks.synthetic_corpus import make_document
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = random.Random(0)
+    roles = sorted(SKILL_CATEGORIES)
+    resumes = {f"r{i}": make_document(rng, rng.choice(roles), n_words=150) for i in range(40)}
+    jds = {f"j{i}": make_document(rng, rng.choice(roles), n_words=80, skill_rate=0.15) for i in range(6)}
+    return resumes, jds
+
+def test_matrix_scores_match_single_jd_scoring(corpus):
+    resumes, jds = corpus
+    scorer = MatrixScorer(jds)
+    texts = list(resumes.values())
+    matrix = scorer.score_block(texts)
+    for j, state in enumerate(scorer.jd_states):
+        kw = [compare_skills(extract_skills(text), state["skills"])[1] for text in texts]
+        expected = ATSScorer(state["text"]).score_batch(texts, kw)
+        np.testing.assert_allclose(matrix[:, j], expected, rtol=1e-6)
+
+def test_rank_top_k_matches_full_matrix(corpus):
+    resumes, jds = corpus
+    scorer = MatrixScorer(jds)
+    full = scorer.score_block(list(resumes.values()))
+    top_jds, top_resumes = scorer.rank(resumes, top_k=3, block_size=7)
+
+    ids = list(resumes)
+    for row, candidate_id in enumerate(ids):
+        assert [score for _, score in top_jds[candidate_id]] == pytest.approx(sorted(full[row], reverse=True)[:3])
+    for j, jd_id in enumerate(scorer.jd_ids):
+        assert [score for _, score in top_resumes[jd_id]] == pytest.approx(sorted(full[:, j], reverse=True)[:3])
+        for candidate_id, score in top_resumes[jd_id]:
+            assert full[ids.index(candidate_id), j] == pytest.approx(score)
+
+def test_empty_jd_set():
+    scorer = MatrixScorer([])
+    assert scorer.rank(["python developer"]) == ({}, {})
@@ -0,0 +1,63 @@
+# tests/test_results_store.py
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from embeddings.results_store import ResultsStore
+from embeddings.skill_taxonomy import SkillTaxonomy, TAXONOMY
+
+def _result(candidate_id, score, resume_skills, required_skills, role="Data Scientist"):
+    return {
+        "candidate_id": candidate_id, "ats_score": score, "keyword_score": score, "role": role,
+        "resume_skills": resume_skills, "required_skills": required_skills,
+        "missing_skills": sorted(set(required_skills) - set(resume_skills)),
+    }
+
+REQUIRED = ["python", "sql", "docker", "aws"]
+
+@pytest.fixture
+def store():
+    store = ResultsStore()
+    store.append([
+        _result("a", 0.9, ["python", "sql", "docker"], REQUIRED),
+        _result("b", 0.7, ["python"], REQUIRED),
+        _result("c", 0.4, ["python", "sql", "docker", "aws"], REQUIRED),
+        {"candidate_id": "broken", "error": "unreadable"},
+    ], jd_id="X", run_id="r1")
+    store.append([_result("a", 0.5, ["python"], ["python", "excel"], role="Data Analyst")], jd_id="Y", run_id="r1")
+    return store
+
+def test_query_filters(store):
+    assert list(store.query(jd_id="X", min_score=0.6).candidate_id) == ["a", "b"]
+    assert list(store.query(jd_id="X", skills=["python", "sql", "docker"], max_missing=0).candidate_id) == ["a", "c"]
+    assert list(store.query(jd_id="X", skills=["sql", "docker", "aws"], max_missing=2).candidate_id) == ["a", "c"]
+    assert list(store.query(role="Data Analyst").candidate_id) == ["a"]
+
+def test_unknown_query_skills_count_as_missing(store):
+    assert "rust-lang-not-a-skill" not in TAXONOMY.skill_ids
+    assert store.query(skills=["rust-lang-not-a-skill"], max_missing=0).empty
+    assert len(store.query(skills=["rust-lang-not-a-skill"], max_missing=1)) == 4
+
+def test_missing_skill_counts(store):
+    assert store.missing_skill_counts("X") == {"sql": 1, "docker": 1, "aws": 2}
+    assert store.missing_skill_counts()["excel"] == 1
+
+def test_round_trip(store, tmp_path):
+    path = str(tmp_path / "results.parquet")
+    store.save(path)
+    loaded = ResultsStore.load(path)
+    assert len(loaded.frame) == 4
+    row = loaded.frame[loaded.frame.candidate_id == "b"].iloc[0]
+    assert loaded.skills_of(row, "missing") == {"sql", "docker", "aws"}
+    assert loaded.skills_of(row, "resume") == {"python"}
+    assert list(loaded.query(jd_id="X", min_score=0.6).candidate_id) == ["a", "b"]
+    loaded.append([_result("d", 0.8, ["aws"], REQUIRED)], jd_id="X")
+    assert len(loaded.frame) == 5
+
+def test_load_rejects_other_taxonomy(store, tmp_path):
+    path = str(tmp_path / "results.parquet")
+    store.save(path)
+    categories = {role: sorted(skills) for role, skills in TAXONOMY.categories.items()}
+    categories[TAXONOMY.roles[0]].append("a-brand-new-skill")
+    with pytest.raises(ValueError):
+        ResultsStore.load(path, SkillTaxonomy(categories))
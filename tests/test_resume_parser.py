@@ -0,0 +1,26 @@
+# tests/test_resume_parser.py
+import os
+
+from preprocessing.resume_parser import run_in_pool
+
+def _square_or_die(n, crash_on):
+    if n == crash_on:
+        os._exit(1)  # simulates an OOM kill / segfault in the worker
+    return n * n
+
+def _fail_on_odd(n):
+    if n % 2:
+        raise ValueError("odd")
+    return n
+
+def test_run_in_pool_yields_every_item():
+    results = {item: (result, error) for item, result, error in run_in_pool(_fail_on_odd, range(20), 2)}
+    assert sorted(results) == list(range(20))
+    assert all(results[n] == (n, None) for n in range(0, 20, 2))
+    assert all(results[n][1] == "ValueError: odd" for n in range(1, 20, 2))
+
+def test_dead_worker_only_fails_its_own_item():
+    results = {item: (result, error) for item, result, error in run_in_pool(_square_or_die, range(30), 2, 7)}
+    assert sorted(results) == list(range(30))
+    assert results[7][0] is None and "BrokenProcessPool" in results[7][1]
+    assert all(results[n] == (n * n, None) for n in range(30) if n != 7)
@@ -0,0 +1,42 @@
+# tests/test_service.py
+import pytest
+
+pytest.importorskip("fastapi")
+
+from app.service import _content_disposition
+
+@pytest.mark.parametrize("name", ["Jane Doe", "李雷", 'a"b', "../x"])
+def test_content_disposition_is_a_valid_latin1_header(name):
+    header = _content_disposition(name)
+    header.encode("latin-1")
+    fallback = header.split('filename="', 1)[1].split('"', 1)[0]
+    assert fallback.endswith("_CareerVantage_Report.pdf")
+    assert "/" not in fallback
+    assert "filename*=UTF-8''" in header
+
+@pytest.fixture(scope="module")
+def client():
+    from fastapi.testclient import TestClient
+    from app.service import app
+
+    with TestClient(app) as client:
+        yield client
+
+PAYLOAD = {"resume_text": "Python developer with SQL", "jd_text": "Hiring: python, sql, docker"}
+
+def test_worker_stage_metrics_reach_the_exported_registry(client):
+    assert client.post("/score", json=PAYLOAD).status_code == 200
+    metrics = client.get("/metrics").text
+    # Stages timed inside the pool worker, not just the api_* wrapper
+    assert 'careervantage_stage_calls_total{stage="extract_skills"}' in metrics
+    assert 'careervantage_stage_calls_total{stage="api_score_one"}' in metrics
+
+def test_profile_flag_returns_a_profile(client):
+    response = client.post("/score?profile=1", json=PAYLOAD)
+    assert response.status_code == 200
+    profile_id = response.headers["X-CareerVantage-Profile"]
+    report = client.get(f"/profiles/{profile_id}").json()
+    assert "function calls" in report["stats"]
+    assert report["peak_memory"] > 0
+    assert "X-CareerVantage-Profile" not in client.post("/score", json=PAYLOAD).headers
+    assert client.get("/profiles/unknown").status_code == 404
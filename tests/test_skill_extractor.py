@@ -0,0 +1,81 @@
+# tests/test_skill_extractor.py
+import random
+
+import pytest
+
+from embeddings.skill_extractor import (
+    ALL_SKILLS, CONTEXT_TERMS, SKILL_CATEGORIES, analyze_jd, detect_job_role, extract_skills,
+    extract_skills_streaming, score_job_roles,
+)
+from benchmarks.bench_skill_extractor import legacy_extract_skills
+from benchmarks.bench_role_detection import make_jd
+
+def _streamed_skills(pages):
+    result = set()
+    for _, skills in extract_skills_streaming(pages):
+        result = skills
+    return result
+
+def _split(rng, text, max_cuts=6):
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, max_cuts))))
+    return [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+
+def _random_text(rng, skills, alphabet="abcxyzJAVA .,/-\n"):
+    parts = []
+    for _ in range(rng.randint(1, 30)):
+        if rng.random() < 0.4:
+            parts.append(rng.choice(skills))
+        else:
+            parts.append("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 80))))
+    return "".join(parts)
+
+@pytest.mark.parametrize("seed", range(3))
+def test_extract_skills_matches_legacy_per_skill_regex(seed):
+    rng = random.Random(seed)
+    skills = sorted(ALL_SKILLS)
+    for _ in range(500):
+        text = _random_text(rng, skills)
+        assert extract_skills(text) == legacy_extract_skills(text), text
+
+def test_extract_skills_word_boundaries():
+    assert extract_skills("JavaScript and Java") == {"javascript", "java"}
+    assert "network security" in extract_skills("network security")
+    assert "security" in extract_skills("network security")
+
+def test_role_scores_count_extracted_skills():
+    # Without context words, each role's score is exactly |extract_skills(jd) & role skills|
+    rng = random.Random(0)
+    jds = [jd for jd in (make_jd(rng) for _ in range(200)) if CONTEXT_TERMS.isdisjoint(jd.split())]
+    assert jds
+    for jd in jds:
+        skills = extract_skills(jd)
+        scores = score_job_roles(jd)
+        assert scores == {role: len(skills & role_skills) for role, role_skills in SKILL_CATEGORIES.items()}
+
+def test_context_boosts_first_matching_group_only():
+    base = score_job_roles("python")
+    boosted = score_job_roles("python at a hospital lab")
+    assert boosted["Doctor"] == base["Doctor"] + 5
+    assert boosted["Scientist"] == base["Scientist"]
+
+def test_role_fallback_and_analyze_jd():
+    assert detect_job_role("nothing relevant here") == "Software Developer"
+    rng = random.Random(1)
+    for _ in range(50):
+        jd = make_jd(rng)
+        assert analyze_jd(jd) == (extract_skills(jd), detect_job_role(jd))
+
+def test_streaming_tail_does_not_start_mid_word():
+    pages = ["linkedin.com/in/xx" + "java." + "y" * 59, " end"]
+    assert _streamed_skills(pages) == extract_skills("".join(pages)) == set()
+
+def test_streaming_finds_skill_split_across_pages():
+    assert "machine learning" in _streamed_skills(["Experience in mach", "ine learning and sql"])
+
+@pytest.mark.parametrize("seed", range(5))
+def test_streaming_matches_extract_skills(seed):
+    rng = random.Random(seed)
+    skills = sorted(ALL_SKILLS)
+    for _ in range(1000):
+        text = _random_text(rng, skills)
+        assert _streamed_skills(_split(rng, text)) == extract_skills(text), text
@@ -0,0 +1,44 @@
+# tests/test_text_cleaner.py
+import random
+import re
+
+import pytest
+
+from preprocessing.text_cleaner import (
+    clean_text_for_pdf, clean_text_for_analysis, clean_texts_for_pdf, clean_texts_for_analysis
+)
+from benchmarks.bench_text_cleaner import legacy_clean_text_for_pdf, legacy_clean_text_for_analysis
+
+ALPHABET = "ab \t\n.-“”‘’–—•é  \U0001F4DA\x00"
+
+def _random_texts(seed, n=500):
+    rng = random.Random(seed)
+    texts = ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 30))) for _ in range(n)]
+    # Mostly-ASCII batches exercise the pass-through path
+    texts += ["plain ascii line"] * 50 + ["", None]
+    rng.shuffle(texts)
+    return texts
+
+@pytest.mark.parametrize("seed", range(3))
+def test_pdf_cleaners_match_legacy(seed):
+    texts = _random_texts(seed)
+    expected = [legacy_clean_text_for_pdf(text) for text in texts]
+    assert [clean_text_for_pdf(text) for text in texts] == expected
+    assert clean_texts_for_pdf(texts) == expected
+
+@pytest.mark.parametrize("seed", range(3))
+def test_analysis_cleaners_match_legacy(seed):
+    texts = _random_texts(seed)
+    expected = [legacy_clean_text_for_analysis(text) for text in texts]
+    assert [clean_text_for_analysis(text) for text in texts] == expected
+    assert clean_texts_for_analysis(texts) == expected
+
+def test_batch_edge_cases():
+    assert clean_texts_for_pdf([]) == []
+    assert clean_texts_for_pdf(["a\x00•", "–"]) == ["a\x00*", "-"]
+
+def test_analysis_batch_keeps_series_index():
+    pd = pytest.importorskip("pandas")
+    series = pd.Series([" a \n b ", None], index=["x", "y"])
+    cleaned = clean_texts_for_analysis(series)
+    assert list(cleaned.index) == ["x", "y"] and list(cleaned) == ["a b", ""]
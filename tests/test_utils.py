@@ -0,0 +1,22 @@
+# tests/test_utils.py
+import io
+import zipfile
+
+import pytest
+
+pytest.importorskip("fpdf")
+
+from app.utils import create_batch_report
+
+def _result(name):
+    return {"name": name, "ats_score": 0.5, "role": "Data Scientist", "missing_skills": ["sql"],
+            "ai_feedback": "Learn SQL.", "resume_skills": ["python"], "required_skills": ["python", "sql"]}
+
+def test_zip_entry_names_are_sanitized():
+    names = ["../../evil/x", "Jane Doe", "C:\\temp\\x", "李雷"]
+    archive = zipfile.ZipFile(io.BytesIO(create_batch_report([_result(n) for n in names], mode="zip", workers=1)))
+    entries = archive.namelist()
+    assert len(entries) == len(names)
+    for entry in entries:
+        assert "/" not in entry and "\\" not in entry and ":" not in entry
+    assert entries[1] == "00002_Jane_Doe_CareerVantage_Report.pdf"
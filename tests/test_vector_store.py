@@ -0,0 +1,89 @@
+# tests/test_vector_store.py
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from embeddings.vector_store import VectorStore
+
+def _vectors(n, dim=8, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+
+def test_persists_across_reopen(tmp_path):
+    vectors = _vectors(5)
+    store = VectorStore(str(tmp_path), 8)
+    store.add([f"k{i}" for i in range(5)], vectors)
+    store.flush()
+
+    reopened = VectorStore(str(tmp_path), 8)
+    assert reopened.keys == [f"k{i}" for i in range(5)]
+    expected = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.testing.assert_allclose(reopened.get(["k3", "k0"]), expected[[3, 0]], rtol=1e-6)
+
+def test_flush_appends_only_new_keys(tmp_path):
+    store = VectorStore(str(tmp_path), 8)
+    store.add(["a", "b"], _vectors(2))
+    store.flush()
+    store.add(["b", "c"], _vectors(2, seed=1))
+    store.flush()
+    store.flush()
+    lines = (tmp_path / "keys.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == ["a", "b", "c"]
+    assert json.loads((tmp_path / "meta.json").read_text()) == {"dim": 8}
+
+def test_unflushed_and_torn_keys_are_dropped(tmp_path):
+    store = VectorStore(str(tmp_path), 8)
+    store.add(["a"], _vectors(1))
+    store.flush()
+    store.add(["lost"], _vectors(1, seed=1))
+    with open(tmp_path / "keys.jsonl", "a", encoding="utf-8") as f:
+        f.write('"tor')
+
+    reopened = VectorStore(str(tmp_path), 8)
+    assert reopened.keys == ["a"]
+    reopened.add(["b"], _vectors(1, seed=2))
+    reopened.flush()
+    assert VectorStore(str(tmp_path), 8).keys == ["a", "b"]
+
+def test_reads_legacy_key_list(tmp_path):
+    store = VectorStore(str(tmp_path), 8)
+    store.add(["a", "b"], _vectors(2))
+    store.flush()
+    (tmp_path / "keys.jsonl").unlink()
+    (tmp_path / "meta.json").write_text(json.dumps({"dim": 8, "keys": ["a", "b"]}))
+
+    reopened = VectorStore(str(tmp_path), 8)
+    reopened.add(["c"], _vectors(1, seed=1))
+    reopened.flush()
+    assert VectorStore(str(tmp_path), 8).keys == ["a", "b", "c"]
+
+def test_dim_mismatch(tmp_path):
+    VectorStore(str(tmp_path), 8)
+    with pytest.raises(ValueError):
+        VectorStore(str(tmp_path), 4)
+
+def test_grows_past_initial_capacity(tmp_path):
+    vectors = _vectors(50)
+    store = VectorStore(str(tmp_path), 8, initial_capacity=4)
+    for start in range(0, 50, 7):
+        store.add([f"k{i}" for i in range(start, min(start + 7, 50))], vectors[start:start + 7])
+    assert len(store) == 50
+    assert store._vectors.shape[0] >= 50
+    expected = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.testing.assert_allclose(store.get([f"k{i}" for i in range(50)]), expected, rtol=1e-6)
+
+def test_search_returns_top_k_best_first(tmp_path):
+    vectors = _vectors(40)
+    store = VectorStore(str(tmp_path), 8)
+    store.add([f"k{i}" for i in range(40)], vectors)
+    query = _vectors(1, seed=7)[0]
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    expected = [f"k{i}" for i in np.argsort(-scores)[:5]]
+    hits = store.search(query, k=5)
+    assert [key for key, _ in hits] == expected
+    assert [score for _, score in hits] == sorted((score for _, score in hits), reverse=True)
+    assert len(store.search(query, k=100)) == 40
+    assert VectorStore(str(tmp_path / "empty"), 8).search(query) == []